@@ -220,12 +220,15 @@ async def sync_coursework(
         # Combine both
         all_items = coursework_list + materials_list
 
+        # Extract video links for all items in one pass
+        video_links_by_item = classroom_service.extract_video_links_batch(all_items)
+
         coursework_repo = CourseworkRepository(db)
         video_link_repo = VideoLinkRepository(db)
         synced_count = 0
         video_count = 0
 
-        for item in all_items:
+        for item, video_links in zip(all_items, video_links_by_item):
             google_coursework_id = item["id"]
 
             # Check if exists
@@ -248,21 +251,19 @@ async def sync_coursework(
 
             synced_count += 1
 
-            # Extract and save video links
-            video_links = classroom_service.extract_video_links(item)
-
+            # Save video links
             for video_data in video_links:
                 # Check if video link exists
-                existing_video = await video_link_repo.get_by_url(video_data["url"])
+                existing_video = await video_link_repo.get_by_url(video_data.url)
 
                 if not existing_video:
                     await video_link_repo.create(
                         coursework_id=existing.id,
-                        url=video_data["url"],
-                        title=video_data.get("title"),
-                        source_type=video_data["source_type"],
-                        drive_file_id=video_data.get("drive_file_id"),
-                        drive_mime_type=video_data.get("drive_mime_type"),
+                        url=video_data.url,
+                        title=video_data.title,
+                        source_type=video_data.source_type,
+                        drive_file_id=video_data.drive_file_id,
+                        drive_mime_type=video_data.drive_mime_type,
                     )
                     video_count += 1
 
@@ -1,8 +1,10 @@
 """
 Courses router simplificado - usa apenas cookies, sem OAuth2!
 """
+import asyncio
 import logging
-from typing import List
+from collections.abc import AsyncIterator
+from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,6 +22,11 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/courses", tags=["courses"])
 
 
+async def _collect(items: AsyncIterator[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Consome um async iterator em uma lista"""
+    return [item async for item in items]
+
+
 def check_cookies():
     """Dependency para verificar se cookies existem"""
     cookie_manager = get_cookie_manager()
@@ -69,9 +76,11 @@ async def sync_courses(
         # Criar serviço do Classroom
         classroom_service = create_classroom_service()
 
-        # Buscar cursos
-        result = await classroom_service.list_courses()
-        courses = result.get("courses", [])
+        # Sync explícito sempre busca dados novos na API
+        classroom_service.invalidate()
+
+        # Buscar cursos (todas as páginas)
+        courses = [course async for course in classroom_service.iter_courses()]
 
         # Salvar no banco
         course_repo = CourseRepository(db)
@@ -151,17 +160,14 @@ async def sync_coursework(
         # Criar serviço
         classroom_service = create_classroom_service()
 
-        # Buscar coursework
-        coursework_result = await classroom_service.list_coursework(
-            course.google_course_id
-        )
-        coursework_list = coursework_result.get("coursework", [])
+        # Sync explícito sempre busca dados novos do curso na API
+        classroom_service.invalidate(course.google_course_id)
 
-        # Buscar materiais
-        materials_result = await classroom_service.list_course_materials(
-            course.google_course_id
+        # Buscar coursework e materiais (todas as páginas) em paralelo
+        coursework_list, materials_list = await asyncio.gather(
+            _collect(classroom_service.iter_coursework(course.google_course_id)),
+            _collect(classroom_service.iter_course_materials(course.google_course_id)),
         )
-        materials_list = materials_result.get("materials", [])
 
         # Combinar
         all_items = coursework_list + materials_list
@@ -169,7 +175,8 @@ async def sync_coursework(
         coursework_repo = CourseworkRepository(db)
         video_link_repo = VideoLinkRepository(db)
         synced_count = 0
-        video_count = 0
+        new_videos: list[dict[str, Any]] = []
+        seen_urls: set[str] = set()
 
         for item in all_items:
             google_coursework_id = item["id"]
@@ -193,23 +200,27 @@ async def sync_coursework(
 
             synced_count += 1
 
-            # Extrair vídeos
-            video_links = classroom_service.extract_video_links(item)
-
-            for video_data in video_links:
-                # Verificar se já existe
-                existing_video = await video_link_repo.get_by_url(video_data["url"])
-
-                if not existing_video:
-                    await video_link_repo.create(
-                        coursework_id=existing.id,
-                        url=video_data["url"],
-                        title=video_data.get("title"),
-                        source_type=video_data["source_type"],
-                        drive_file_id=video_data.get("drive_file_id"),
-                        drive_mime_type=video_data.get("drive_mime_type"),
-                    )
-                    video_count += 1
+            # Extrair vídeos (gerador: um link por vez)
+            for video_data in classroom_service.extract_video_links(item):
+                url = video_data["url"]
+
+                # Verificar se já existe (no banco ou neste sync)
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+
+                if not await video_link_repo.get_by_url(url):
+                    new_videos.append({
+                        "coursework_id": existing.id,
+                        "url": url,
+                        "title": video_data.get("title"),
+                        "source_type": video_data["source_type"],
+                        "drive_file_id": video_data.get("drive_file_id"),
+                        "drive_mime_type": video_data.get("drive_mime_type"),
+                    })
+
+        # Inserir todos os vídeos novos em um único round-trip
+        video_count = await video_link_repo.create_many(new_videos)
 
         await db.commit()
 
@@ -58,6 +58,10 @@ class Settings(BaseSettings):
     # Workers
     worker_poll_interval_seconds: int = Field(default=5, description="Worker queue polling interval")
     worker_max_retries: int = Field(default=3, description="Max download retries")
+    worker_shutdown_timeout_seconds: int = Field(
+        default=30,
+        description="Max time to wait for cancelled downloads on shutdown",
+    )
 
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
@@ -93,6 +97,14 @@ class Settings(BaseSettings):
         default="%(id)s.%(ext)s",
         description="yt-dlp output filename template",
     )
+    ytdlp_force_transcode: bool = Field(
+        default=False,
+        description="Re-encode downloads to mp4 instead of remuxing",
+    )
+    ytdlp_concurrent_fragments: int = Field(
+        default=4,
+        description="Fragments downloaded in parallel (HLS/DASH)",
+    )
 
     @property
     def download_path(self) -> Path:
@@ -1,16 +1,16 @@
 """Database module - exports database utilities"""
 from app.db.database import (
-    AsyncSessionLocal,
     close_db,
-    engine,
     get_db,
     get_db_context,
+    get_engine,
+    get_sessionmaker,
     init_db,
 )
 
 __all__ = [
-    "engine",
-    "AsyncSessionLocal",
+    "get_engine",
+    "get_sessionmaker",
     "init_db",
     "close_db",
     "get_db",
@@ -3,6 +3,7 @@ Database connection and session management
 """
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Optional
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -14,25 +15,48 @@ from sqlalchemy.ext.asyncio import (
 from app.core.config import get_settings
 from app.domain.models import Base
 
-settings = get_settings()
+# Created on first use, so importing this module never builds an engine
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
 
-# Create async engine
-engine: AsyncEngine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+def get_engine() -> AsyncEngine:
+    """
+    Get singleton async engine, creating it on first use
+
+    Returns:
+        AsyncEngine bound to settings.database_url
+    """
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        _engine = create_async_engine(
+            settings.database_url,
+            echo=settings.debug,
+            pool_pre_ping=True,
+            pool_size=5,
+            max_overflow=10,
+        )
+    return _engine
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Get singleton async session factory bound to the engine
+
+    Returns:
+        async_sessionmaker for AsyncSession
+    """
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+    return _session_factory
 
 
 async def init_db() -> None:
@@ -41,7 +65,7 @@ async def init_db() -> None:
 
     Note: In production, use Alembic migrations instead
     """
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
@@ -49,7 +73,11 @@ async def close_db() -> None:
     """
     Close database engine and dispose connections
     """
-    await engine.dispose()
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+        _session_factory = None
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -64,7 +92,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession: Database session
     """
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         try:
             yield session
             await session.commit()
@@ -87,7 +115,7 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession: Database session
     """
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         try:
             yield session
             await session.commit()
@@ -12,6 +12,8 @@ from app.api.middleware.logging import RequestLoggingMiddleware
 from app.core.config import get_settings
 from app.core.logging import configure_logging, get_logger
 from app.db import close_db, init_db
+from app.services.http_client import close_http_client
+from app.services.video_downloader import close_video_downloader
 from app.workers import get_download_worker
 
 settings = get_settings()
@@ -55,6 +57,14 @@ async def lifespan(app: FastAPI):
     worker_task.cancel()
     logger.info("worker_stopped")
 
+    # Release yt-dlp threads
+    close_video_downloader()
+    logger.info("video_downloader_closed")
+
+    # Close pooled HTTP connections
+    await close_http_client()
+    logger.info("http_client_closed")
+
     # Close database
     logger.info("database_closing")
     await close_db()
@@ -1,9 +1,10 @@
 """
 Base repository with generic CRUD operations
 """
+from collections.abc import Iterable
 from typing import Any, Generic, Optional, Type, TypeVar
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.models import Base
@@ -76,6 +77,50 @@ class BaseRepository(Generic[ModelType]):
         await self.db.refresh(instance)
         return instance
 
+    async def create_many(self, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Insert many records in a single executemany round-trip
+
+        Args:
+            rows: Field dicts (all with the same keys)
+
+        Returns:
+            Number of records inserted
+        """
+        rows = list(rows)
+        if rows:
+            await self.db.execute(insert(self.model), rows)
+        return len(rows)
+
+    async def add(self, instance: ModelType) -> ModelType:
+        """
+        Add a model instance and flush it (committing is left to the caller)
+
+        Args:
+            instance: Model instance to add
+
+        Returns:
+            Added instance (with ID assigned)
+        """
+        self.db.add(instance)
+        await self.db.flush()
+        return instance
+
+    async def add_all(self, instances: Iterable[ModelType]) -> list[ModelType]:
+        """
+        Add model instances and flush them together
+
+        Args:
+            instances: Model instances to add
+
+        Returns:
+            Added instances (with IDs assigned)
+        """
+        instances = list(instances)
+        self.db.add_all(instances)
+        await self.db.flush()
+        return instances
+
     async def update(self, id: int, **kwargs: Any) -> Optional[ModelType]:
         """
         Update a record
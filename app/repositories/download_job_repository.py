@@ -96,6 +96,39 @@ class DownloadJobRepository(BaseRepository[DownloadJob]):
         )
         return list(result.scalars().all())
 
+    async def claim_pending(self, limit: int) -> list[DownloadJob]:
+        """
+        Atomically claim pending jobs and mark them as downloading
+
+        Rows are selected with FOR UPDATE SKIP LOCKED, so concurrent workers
+        never claim the same job. The caller must commit to release the locks.
+
+        Args:
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            List of claimed download jobs
+        """
+        if limit <= 0:
+            return []
+
+        result = await self.db.execute(
+            select(DownloadJob)
+            .where(DownloadJob.status == DownloadStatus.PENDING)
+            .order_by(DownloadJob.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        jobs = list(result.scalars().all())
+
+        started_at = datetime.utcnow()
+        for job in jobs:
+            job.status = DownloadStatus.DOWNLOADING
+            job.started_at = started_at
+        await self.db.flush()
+
+        return jobs
+
     async def get_with_details(self, job_id: int) -> Optional[dict]:
         """
         Get download job with related details
@@ -1,7 +1,9 @@
 """
 Cookie manager - armazena e gerencia cookies do usuário com criptografia
 """
+import hashlib
 import json
+import os
 import re
 from pathlib import Path
 from typing import Optional
@@ -12,6 +14,17 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of parsed curl files kept in the on-disk cache
+CURL_CACHE_MAX_ENTRIES = 4
+
+# Read buffer for streaming curl files
+CURL_FILE_BUFFER_SIZE = 65536
+
+# Cookie argument of a curl command: -b '...' / -b "..." or -H 'Cookie: ...'
+_CURL_COOKIE_RE = re.compile(
+    r"""-b\s+'([^']+)'|-b\s+"([^"]+)"|-H\s+(['"])[Cc]ookie:\s*(.+?)\3"""
+)
+
 
 class CookieManager:
     """
@@ -36,6 +49,8 @@ class CookieManager:
         self.cookies_file.parent.mkdir(parents=True, exist_ok=True)
         self.encryption_key = encryption_key
         self.cipher = None
+        # Parsed files: path -> (st_mtime_ns, st_size, cookies)
+        self._parsed: dict[Path, tuple[int, int, dict[str, str]]] = {}
 
         if encryption_key:
             try:
@@ -67,8 +82,11 @@ class CookieManager:
             cookies_dict: Dictionary of cookie name -> value
         """
         try:
-            # Serialize to JSON
-            plaintext = json.dumps(cookies_dict, indent=2)
+            # Serialize to JSON (indent only helps when the file is readable)
+            if self.cipher:
+                plaintext = json.dumps(cookies_dict)
+            else:
+                plaintext = json.dumps(cookies_dict, indent=2)
 
             if self.cipher:
                 # Encrypt
@@ -93,21 +111,34 @@ class CookieManager:
             logger.error("cookies_save_failed", error=str(e), exc_info=True)
             raise
 
+        finally:
+            # Never serve the previous contents from memory
+            self._parsed.pop(self.cookies_file, None)
+
     def load_cookies(self) -> Optional[dict[str, str]]:
         """
         Load cookies from file (decrypted if encrypted)
 
+        Parsed cookies are kept in memory and reused while the file's mtime
+        and size are unchanged.
+
         Returns:
             Dictionary of cookie name -> value or None
         """
         try:
-            if not self.cookies_file.exists():
+            try:
+                stat = self.cookies_file.stat()
+            except FileNotFoundError:
                 logger.warning(
                     "cookies_file_not_found",
                     file_path=str(self.cookies_file),
                 )
                 return None
 
+            cached = self._get_parsed(self.cookies_file, stat)
+            if cached is not None:
+                return cached
+
             if self.cipher:
                 # Read and decrypt
                 encrypted = self.cookies_file.read_bytes()
@@ -130,6 +161,7 @@ class CookieManager:
                 count=len(cookies),
                 encrypted=self.cipher is not None,
             )
+            self._set_parsed(self.cookies_file, stat, cookies)
             return cookies
 
         except Exception as e:
@@ -146,33 +178,49 @@ class CookieManager:
         Returns:
             Dictionary of cookie name -> value
         """
-        cookies = {}
-
-        # Find -b flag with cookies
-        cookie_match = re.search(r"-b\s+'([^']+)'", curl_command)
-        if not cookie_match:
-            cookie_match = re.search(r'-b\s+"([^"]+)"', curl_command)
+        # Find -b flag (or Cookie header) with cookies
+        cookie_match = _CURL_COOKIE_RE.search(curl_command)
 
         if not cookie_match:
             logger.warning("Nenhum cookie encontrado no comando curl")
-            return cookies
-
-        cookie_string = cookie_match.group(1)
+            return {}
 
-        # Parse cookies (format: name=value; name2=value2)
-        for cookie in cookie_string.split("; "):
-            cookie = cookie.strip()
-            if "=" in cookie:
-                name, value = cookie.split("=", 1)
-                cookies[name.strip()] = value.strip()
+        cookies = self._parse_cookie_string(cookie_match)
 
         logger.info("cookies_parsed", count=len(cookies))
         return cookies
 
+    def _parse_cookie_string(self, cookie_match: re.Match) -> dict[str, str]:
+        """
+        Parse the cookie string captured by _CURL_COOKIE_RE
+
+        Args:
+            cookie_match: Match of a curl cookie argument
+
+        Returns:
+            Dictionary of cookie name -> value
+        """
+        cookie_string = cookie_match.group(1) or cookie_match.group(2) or cookie_match.group(4)
+
+        # Parse cookies (format: name=value; name2=value2) with one split and
+        # a partition per pair; entries without "=" or a name are skipped
+        pairs = (cookie.partition("=") for cookie in cookie_string.split(";"))
+        cookies = {}
+        for name, sep, value in pairs:
+            name = name.strip()
+            if sep and name:
+                cookies[name] = value.strip()
+        return cookies
+
     def parse_curl_file(self, curl_file: Path) -> dict[str, str]:
         """
         Parse cookies from curl file (multiple curl commands)
 
+        The file is streamed line by line through a 64 KB buffer, so large
+        dumps are never fully loaded. Results are cached in memory and, when
+        encryption is enabled, on disk, keyed by file path, mtime and size,
+        so re-importing an unchanged file skips the regex parsing.
+
         Args:
             curl_file: Path to file with curl commands
 
@@ -182,22 +230,143 @@ class CookieManager:
         cookies = {}
 
         try:
-            content = curl_file.read_text(encoding="utf-8")
-
-            # Find all curl commands
-            curl_commands = re.findall(r"curl\s+'[^']+'\s+(?:[^\n]+\n?)+", content)
-
-            for curl_cmd in curl_commands:
-                cmd_cookies = self.parse_curl_cookies(curl_cmd)
-                cookies.update(cmd_cookies)
+            stat = curl_file.stat()
+            cached = self._get_parsed(curl_file, stat)
+            if cached is not None:
+                return cached
+
+            cache_file = self._curl_cache_file(curl_file)
+            cached = self._read_curl_cache(cache_file, stat)
+            if cached is not None:
+                logger.info("cookies_parsed_from_cache", unique_count=len(cached))
+                self._set_parsed(curl_file, stat, cached)
+                return cached
+
+            # Cookie arguments sit on their own line in "copy as cURL" output
+            with open(curl_file, encoding="utf-8", buffering=CURL_FILE_BUFFER_SIZE) as f:
+                for line in f:
+                    for cookie_match in _CURL_COOKIE_RE.finditer(line):
+                        cookies.update(self._parse_cookie_string(cookie_match))
 
             logger.info("cookies_parsed_from_file", unique_count=len(cookies))
+            self._write_curl_cache(cache_file, stat, cookies)
+            self._set_parsed(curl_file, stat, cookies)
             return cookies
 
         except Exception as e:
             logger.error("curl_file_parse_failed", error=str(e), exc_info=True)
             return {}
 
+    def _get_parsed(self, path: Path, stat: os.stat_result) -> Optional[dict[str, str]]:
+        """
+        Get cookies parsed from a file in memory, if the file is unchanged
+
+        Args:
+            path: Parsed file path
+            stat: Current stat of the file
+
+        Returns:
+            Copy of the cached cookies or None on miss
+        """
+        cached = self._parsed.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return dict(cached[2])
+        return None
+
+    def _set_parsed(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        cookies: dict[str, str],
+    ) -> None:
+        """
+        Keep cookies parsed from a file in memory
+
+        Args:
+            path: Parsed file path
+            stat: Stat of the file when it was read
+            cookies: Parsed cookies
+        """
+        self._parsed[path] = (stat.st_mtime_ns, stat.st_size, dict(cookies))
+
+    def _curl_cache_file(self, curl_file: Path) -> Path:
+        """
+        Get cache file path for a curl file
+
+        One entry per path, so a changed file overwrites its stale entry.
+
+        Args:
+            curl_file: Path to file with curl commands
+
+        Returns:
+            Path of the cache entry
+        """
+        digest = hashlib.sha256(str(curl_file.resolve()).encode()).hexdigest()
+        return self.cookies_file.parent / "curl_cache" / f"{digest}.json"
+
+    def _read_curl_cache(
+        self,
+        cache_file: Path,
+        stat: os.stat_result,
+    ) -> Optional[dict[str, str]]:
+        """
+        Read parsed cookies from the encrypted curl cache
+
+        Args:
+            cache_file: Cache entry path
+            stat: Current stat of the curl file
+
+        Returns:
+            Cached cookies or None on miss (or when encryption is disabled)
+        """
+        if not self.cipher:
+            return None
+
+        try:
+            entry = json.loads(self.cipher.decrypt(cache_file.read_bytes()))
+            if (entry["mtime_ns"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+                return None
+            return entry["cookies"]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("curl_cache_read_failed", error=str(e))
+            return None
+
+    def _write_curl_cache(
+        self,
+        cache_file: Path,
+        stat: os.stat_result,
+        cookies: dict[str, str],
+    ) -> None:
+        """
+        Store parsed cookies in the curl cache, evicting the oldest entries
+
+        Session cookies are never written to disk in plaintext, so nothing is
+        stored when encryption is disabled.
+
+        Args:
+            cache_file: Cache entry path
+            stat: Stat of the curl file when it was read
+            cookies: Parsed cookies
+        """
+        if not self.cipher:
+            return
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "cookies": cookies}
+            cache_file.write_bytes(self.cipher.encrypt(json.dumps(entry).encode()))
+
+            entries = sorted(
+                cache_file.parent.glob("*.json"),
+                key=lambda entry: entry.stat().st_mtime_ns,
+            )
+            for entry in entries[:-CURL_CACHE_MAX_ENTRIES]:
+                entry.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning("curl_cache_write_failed", error=str(e))
+
     def get_cookie_dict(self) -> dict[str, str]:
         """
         Get cookies as dictionary for httpx
@@ -215,7 +384,11 @@ class CookieManager:
         Returns:
             True if cookies exist
         """
-        return self.cookies_file.exists()
+        try:
+            self.cookies_file.stat()
+        except OSError:
+            return False
+        return True
 
 
 # Singleton instance
@@ -3,6 +3,7 @@ Credentials manager for encrypting/decrypting Google OAuth2 credentials
 """
 import json
 import logging
+from functools import cache
 from typing import Any, Optional
 
 from cryptography.fernet import Fernet
@@ -11,7 +12,20 @@ from google.oauth2.credentials import Credentials
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
+
+
+@cache
+def _fernet_for(key: str) -> Fernet:
+    """
+    Get a Fernet cipher for a key, shared by all managers using that key
+
+    Args:
+        key: Fernet encryption key
+
+    Returns:
+        Fernet cipher
+    """
+    return Fernet(key.encode())
 
 
 class CredentialsManager:
@@ -20,7 +34,7 @@ class CredentialsManager:
     def __init__(self):
         """Initialize with encryption key from settings"""
         try:
-            self.cipher = Fernet(settings.encryption_key.encode())
+            self.cipher = _fernet_for(get_settings().encryption_key)
         except Exception as e:
             logger.error(f"Failed to initialize Fernet cipher: {e}")
             raise ValueError("Invalid encryption key. Generate one with: python -c 'from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())'")
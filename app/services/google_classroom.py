@@ -1,12 +1,16 @@
 """
 Google Classroom API service
 """
+import json
 import logging
 import re
-from typing import Any, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseDownload
 
@@ -15,6 +19,111 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+_URL_RE = re.compile(r"https?://[^\s<>\"']+")
+
+# Joins descriptions for batch scanning; URLs never span whitespace
+_DESCRIPTION_SEPARATOR = "\n\x00\n"
+
+
+@lru_cache(maxsize=None)
+def _get_discovery_document(service_name: str, version: str) -> Optional[dict[str, Any]]:
+    """
+    Load and parse a bundled discovery document once per process
+
+    Args:
+        service_name: Google API name (e.g. "classroom")
+        version: API version (e.g. "v1")
+
+    Returns:
+        Parsed discovery document or None if it is not bundled
+    """
+    document = get_static_doc(service_name, version)
+    if document is None:
+        return None
+    return json.loads(document)
+
+
+def _build_service(service_name: str, version: str, credentials: Credentials) -> Any:
+    """
+    Build a Google API resource reusing the cached discovery document
+
+    Args:
+        service_name: Google API name
+        version: API version
+        credentials: Google OAuth2 Credentials
+
+    Returns:
+        Google API resource object
+    """
+    document = _get_discovery_document(service_name, version)
+    if document is None:
+        return build(service_name, version, credentials=credentials)
+    return build_from_document(document, credentials=credentials)
+
+
+@lru_cache(maxsize=4096)
+def _is_video_url(url: str) -> bool:
+    """
+    Check if URL is likely a video
+
+    Memoized because the same links tend to repeat across coursework items.
+
+    Args:
+        url: URL to check
+
+    Returns:
+        True if URL appears to be a video
+    """
+    video_domains = [
+        "youtube.com",
+        "youtu.be",
+        "drive.google.com",
+        "vimeo.com",
+        "dailymotion.com",
+        "wistia.com",
+    ]
+
+    url_lower = url.lower()
+    return any(domain in url_lower for domain in video_domains)
+
+
+@lru_cache(maxsize=4096)
+def _detect_video_source(url: str) -> str:
+    """
+    Detect video source from URL
+
+    Args:
+        url: Video URL
+
+    Returns:
+        Source type string
+    """
+    url_lower = url.lower()
+
+    if "youtube.com" in url_lower or "youtu.be" in url_lower:
+        return "youtube"
+    elif "drive.google.com" in url_lower:
+        return "drive"
+    elif "vimeo.com" in url_lower:
+        return "vimeo"
+    elif "dailymotion.com" in url_lower:
+        return "dailymotion"
+    elif "wistia.com" in url_lower:
+        return "wistia"
+    else:
+        return "other"
+
+
+class ExtractedVideoLink(NamedTuple):
+    """Video link extracted from a coursework or material item"""
+
+    url: str
+    title: Optional[str]
+    source_type: str
+    video_id: Optional[str] = None
+    drive_file_id: Optional[str] = None
+    drive_mime_type: Optional[str] = None
+
 
 class GoogleClassroomService:
     """Service for interacting with Google Classroom API"""
@@ -27,8 +136,8 @@ class GoogleClassroomService:
             credentials: Google OAuth2 Credentials
         """
         self.credentials = credentials
-        self.classroom_service = build("classroom", "v1", credentials=credentials)
-        self.drive_service = build("drive", "v3", credentials=credentials)
+        self.classroom_service = _build_service("classroom", "v1", credentials)
+        self.drive_service = _build_service("drive", "v3", credentials)
 
     async def list_courses(
         self,
@@ -169,7 +278,7 @@ class GoogleClassroomService:
     def extract_video_links(
         self,
         coursework_or_material: dict[str, Any],
-    ) -> list[dict[str, Any]]:
+    ) -> list[ExtractedVideoLink]:
         """
         Extract video links from coursework or material
 
@@ -177,9 +286,9 @@ class GoogleClassroomService:
             coursework_or_material: Coursework or material dictionary
 
         Returns:
-            List of video link dictionaries with url, title, source_type
+            List of extracted video links (use ``_asdict()`` where a dict is needed)
         """
-        video_links = []
+        video_links: list[ExtractedVideoLink] = []
 
         # Check description for URLs
         description = coursework_or_material.get("description", "")
@@ -187,48 +296,110 @@ class GoogleClassroomService:
             video_links.extend(self._extract_urls_from_text(description))
 
         # Check materials
-        materials = coursework_or_material.get("materials", [])
+        video_links.extend(
+            self._extract_material_links(coursework_or_material.get("materials", []))
+        )
+
+        return video_links
+
+    def extract_video_links_batch(
+        self,
+        items: list[dict[str, Any]],
+    ) -> list[list[ExtractedVideoLink]]:
+        """
+        Extract video links from many coursework or material items at once
+
+        Descriptions are scanned in a single regex pass over the joined text
+        instead of once per item.
+
+        Args:
+            items: Coursework or material dictionaries
+
+        Returns:
+            One list of extracted video links per item, in input order
+        """
+        descriptions = [item.get("description") or "" for item in items]
+
+        # Start offset of each description inside the joined text
+        offsets = []
+        position = 0
+        for description in descriptions:
+            offsets.append(position)
+            position += len(description) + len(_DESCRIPTION_SEPARATOR)
+
+        video_links: list[list[ExtractedVideoLink]] = [[] for _ in items]
+        for match in _URL_RE.finditer(_DESCRIPTION_SEPARATOR.join(descriptions)):
+            url = match.group()
+            source_type = _detect_video_source(url)
+            if source_type != "other":
+                index = bisect_right(offsets, match.start()) - 1
+                video_links[index].append(ExtractedVideoLink(
+                    url=url,
+                    title=None,
+                    source_type=source_type,
+                ))
+
+        for item_links, item in zip(video_links, items):
+            item_links.extend(self._extract_material_links(item.get("materials", [])))
+
+        return video_links
+
+    def _extract_material_links(
+        self,
+        materials: list[dict[str, Any]],
+    ) -> list[ExtractedVideoLink]:
+        """
+        Extract video links from attached materials
+
+        Args:
+            materials: Materials list of a coursework or material item
+
+        Returns:
+            List of extracted video links
+        """
+        video_links = []
+
         for material in materials:
             # YouTube video
             if "youtubeVideo" in material:
                 youtube = material["youtubeVideo"]
-                video_links.append({
-                    "url": f"https://www.youtube.com/watch?v={youtube['id']}",
-                    "title": youtube.get("title"),
-                    "source_type": "youtube",
-                    "video_id": youtube["id"],
-                })
+                video_links.append(ExtractedVideoLink(
+                    url=f"https://www.youtube.com/watch?v={youtube['id']}",
+                    title=youtube.get("title"),
+                    source_type="youtube",
+                    video_id=youtube["id"],
+                ))
 
             # Google Drive file
             elif "driveFile" in material:
                 drive_file = material["driveFile"]["driveFile"]
                 file_id = drive_file["id"]
-                mime_type = drive_file.get("mimeType", "")
+                mime_type = drive_file.get("mimeType")
 
                 # Only process video files
-                if mime_type.startswith("video/"):
-                    video_links.append({
-                        "url": f"https://drive.google.com/file/d/{file_id}/view",
-                        "title": drive_file.get("title"),
-                        "source_type": "drive",
-                        "drive_file_id": file_id,
-                        "drive_mime_type": mime_type,
-                    })
+                if mime_type and mime_type[:6] == "video/":
+                    video_links.append(ExtractedVideoLink(
+                        url=f"https://drive.google.com/file/d/{file_id}/view",
+                        title=drive_file.get("title"),
+                        source_type="drive",
+                        drive_file_id=file_id,
+                        drive_mime_type=mime_type,
+                    ))
 
             # Link with potential video
             elif "link" in material:
                 link = material["link"]
                 url = link.get("url", "")
                 if self._is_video_url(url):
-                    video_links.append({
-                        "url": url,
-                        "title": link.get("title"),
-                        "source_type": self._detect_video_source(url),
-                    })
+                    video_links.append(ExtractedVideoLink(
+                        url=url,
+                        title=link.get("title"),
+                        source_type=self._detect_video_source(url),
+                    ))
 
         return video_links
 
-    def _extract_urls_from_text(self, text: str) -> list[dict[str, Any]]:
+    def _extract_urls_from_text(self, text: str) -> list[ExtractedVideoLink]:
         """
         Extract video URLs from text
 
@@ -236,70 +407,29 @@ class GoogleClassroomService:
             text: Text to search for URLs
 
         Returns:
-            List of video link dictionaries
+            List of extracted video links
         """
         video_links = []
 
-        # URL regex pattern
-        url_pattern = r"https?://[^\s<>\"']+"
-        urls = re.findall(url_pattern, text)
-
-        for url in urls:
-            if self._is_video_url(url):
-                video_links.append({
-                    "url": url,
-                    "title": None,
-                    "source_type": self._detect_video_source(url),
-                })
+        for match in _URL_RE.finditer(text):
+            url = match.group()
+            source_type = _detect_video_source(url)
+            if source_type != "other":
+                video_links.append(ExtractedVideoLink(
+                    url=url,
+                    title=None,
+                    source_type=source_type,
+                ))
 
         return video_links
 
     def _is_video_url(self, url: str) -> bool:
-        """
-        Check if URL is likely a video
-
-        Args:
-            url: URL to check
-
-        Returns:
-            True if URL appears to be a video
-        """
-        video_domains = [
-            "youtube.com",
-            "youtu.be",
-            "drive.google.com",
-            "vimeo.com",
-            "dailymotion.com",
-            "wistia.com",
-        ]
-
-        url_lower = url.lower()
-        return any(domain in url_lower for domain in video_domains)
+        """Check if URL is likely a video (see module-level _is_video_url)"""
+        return _is_video_url(url)
 
     def _detect_video_source(self, url: str) -> str:
-        """
-        Detect video source from URL
-
-        Args:
-            url: Video URL
-
-        Returns:
-            Source type string
-        """
-        url_lower = url.lower()
-
-        if "youtube.com" in url_lower or "youtu.be" in url_lower:
-            return "youtube"
-        elif "drive.google.com" in url_lower:
-            return "drive"
-        elif "vimeo.com" in url_lower:
-            return "vimeo"
-        elif "dailymotion.com" in url_lower:
-            return "dailymotion"
-        elif "wistia.com" in url_lower:
-            return "wistia"
-        else:
-            return "other"
+        """Detect video source from URL (see module-level _detect_video_source)"""
+        return _detect_video_source(url)
 
     async def get_drive_file_info(self, file_id: str) -> Optional[dict[str, Any]]:
         """
@@ -1,14 +1,61 @@
 """
 Google Classroom service usando apenas cookies (sem OAuth2)
 """
+import asyncio
+import copy
 import logging
 import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from typing import Any, Optional
+from urllib.parse import urlparse
 
 from app.services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# Itens por página nas listagens (menos páginas = menos round-trips)
+_PAGE_SIZE = 100
+
+# Páginas buscadas à frente do consumidor nos iteradores paginados
+_PAGE_PREFETCH = 4
+
+# Classe negada sem alternâncias: a varredura já é linear no re padrão, e
+# \s também para em separadores Unicode (NBSP, em space)
+_URL_RE = re.compile(r"https?://[^\s<>\"']+")
+
+# Domínio -> fonte do vídeo (subdomínios são resolvidos por _video_source)
+_DOMAIN_SOURCE = {
+    "youtube.com": "youtube",
+    "youtu.be": "youtube",
+    "drive.google.com": "drive",
+    "vimeo.com": "vimeo",
+    "dailymotion.com": "other",
+}
+
+
+def _video_source(url: str) -> Optional[str]:
+    """Fonte do vídeo pelo host da URL, ou None se não for vídeo"""
+    try:
+        host = urlparse(url).hostname
+    except ValueError:
+        return None
+
+    # www.youtube.com -> youtube.com -> com
+    while host:
+        source = _DOMAIN_SOURCE.get(host)
+        if source:
+            return source
+        _, _, host = host.partition(".")
+
+    return None
+
+
+# Cache em memória das respostas da API: chave -> (expira_em, dados)
+_CACHE_TTL_SECONDS = 300
+_CACHE_MAX_ENTRIES = 1024
+_response_cache: dict[tuple[str, tuple[tuple[str, Any], ...]], tuple[float, Any]] = {}
+
 
 class GoogleClassroomSimpleService:
     """
@@ -32,16 +79,11 @@ class GoogleClassroomSimpleService:
             Dict com courses e nextPageToken
         """
         try:
-            params = {"pageSize": 50}
+            params = {"pageSize": _PAGE_SIZE}
             if page_token:
                 params["pageToken"] = page_token
 
-            response = await self.http_client.get(
-                f"{self.base_url}/courses",
-                params=params,
-            )
-
-            data = response.json()
+            data = await self._get_json(f"{self.base_url}/courses", params)
             return {
                 "courses": data.get("courses", []),
                 "nextPageToken": data.get("nextPageToken"),
@@ -62,10 +104,7 @@ class GoogleClassroomSimpleService:
             Dados do curso ou None
         """
         try:
-            response = await self.http_client.get(
-                f"{self.base_url}/courses/{course_id}"
-            )
-            return response.json()
+            return await self._get_json(f"{self.base_url}/courses/{course_id}")
 
         except Exception as e:
             logger.error(f"Erro ao buscar curso {course_id}: {e}")
@@ -87,16 +126,14 @@ class GoogleClassroomSimpleService:
             Dict com coursework e nextPageToken
         """
         try:
-            params = {"pageSize": 50}
+            params = {"pageSize": _PAGE_SIZE}
             if page_token:
                 params["pageToken"] = page_token
 
-            response = await self.http_client.get(
+            data = await self._get_json(
                 f"{self.base_url}/courses/{course_id}/courseWork",
-                params=params,
+                params,
             )
-
-            data = response.json()
             return {
                 "coursework": data.get("courseWork", []),
                 "nextPageToken": data.get("nextPageToken"),
@@ -122,16 +159,14 @@ class GoogleClassroomSimpleService:
             Dict com materials e nextPageToken
         """
         try:
-            params = {"pageSize": 50}
+            params = {"pageSize": _PAGE_SIZE}
             if page_token:
                 params["pageToken"] = page_token
 
-            response = await self.http_client.get(
+            data = await self._get_json(
                 f"{self.base_url}/courses/{course_id}/courseWorkMaterials",
-                params=params,
+                params,
             )
-
-            data = response.json()
             return {
                 "materials": data.get("courseWorkMaterial", []),
                 "nextPageToken": data.get("nextPageToken"),
@@ -141,25 +176,216 @@ class GoogleClassroomSimpleService:
             logger.error(f"Erro ao listar materiais do curso {course_id}: {e}")
             raise
 
+    async def _get_json(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """
+        GET com cache TTL em memória (compartilhado entre instâncias)
+
+        Cada chamada recebe sua própria cópia dos dados, então alterar o
+        resultado não afeta o cache nem outros chamadores.
+
+        Args:
+            url: URL da API
+            params: Query parameters
+
+        Returns:
+            JSON da resposta
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        now = time.monotonic()
+
+        cached = _response_cache.get(key)
+        if cached and cached[0] > now:
+            return copy.deepcopy(cached[1])
+
+        response = await self.http_client.get(url, params=params)
+        data = response.json()
+
+        if len(_response_cache) >= _CACHE_MAX_ENTRIES:
+            # Remove a entrada mais antiga (dict mantém ordem de inserção)
+            _response_cache.pop(next(iter(_response_cache)))
+        _response_cache[key] = (now + _CACHE_TTL_SECONDS, copy.deepcopy(data))
+        return data
+
+    def invalidate(self, course_id: Optional[str] = None) -> None:
+        """
+        Invalida respostas em cache
+
+        Args:
+            course_id: ID do curso (None limpa todo o cache)
+        """
+        if course_id is None:
+            _response_cache.clear()
+            return
+
+        course_url = f"{self.base_url}/courses/{course_id}"
+        stale = [
+            key for key in _response_cache
+            if key[0] == course_url or key[0].startswith(f"{course_url}/")
+        ]
+        for key in stale:
+            del _response_cache[key]
+
+    def iter_courses(self) -> AsyncIterator[dict[str, Any]]:
+        """
+        Itera todos os cursos, percorrendo todas as páginas
+
+        Returns:
+            Async iterator de cursos
+        """
+        return self._iter_pages(
+            lambda token: self.list_courses(page_token=token),
+            "courses",
+        )
+
+    def iter_coursework(self, course_id: str) -> AsyncIterator[dict[str, Any]]:
+        """
+        Itera todo o coursework de um curso, percorrendo todas as páginas
+
+        Args:
+            course_id: ID do curso
+
+        Returns:
+            Async iterator de coursework
+        """
+        return self._iter_pages(
+            lambda token: self.list_coursework(course_id, page_token=token),
+            "coursework",
+        )
+
+    def iter_course_materials(self, course_id: str) -> AsyncIterator[dict[str, Any]]:
+        """
+        Itera todos os materiais de um curso, percorrendo todas as páginas
+
+        Args:
+            course_id: ID do curso
+
+        Returns:
+            Async iterator de materiais
+        """
+        return self._iter_pages(
+            lambda token: self.list_course_materials(course_id, page_token=token),
+            "materials",
+        )
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[Optional[str]], Awaitable[dict[str, Any]]],
+        items_key: str,
+        prefetch: int = _PAGE_PREFETCH,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Itera itens paginados com um produtor que busca páginas à frente
+
+        O token da próxima página só vem na resposta da atual, então as
+        páginas são buscadas em sequência, mas até `prefetch` delas ficam
+        prontas enquanto o consumidor processa as anteriores.
+
+        Args:
+            fetch_page: Função que busca uma página pelo token
+            items_key: Chave da lista de itens na página
+            prefetch: Máximo de páginas buscadas à frente do consumidor
+
+        Yields:
+            Itens de todas as páginas, em ordem
+        """
+        pages: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+
+        async def produce() -> None:
+            token = None
+            try:
+                while True:
+                    page = await fetch_page(token)
+                    await pages.put(page)
+                    token = page.get("nextPageToken")
+                    if not token:
+                        break
+            except Exception as e:
+                await pages.put(e)
+                return
+            await pages.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (page := await pages.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                for item in page[items_key]:
+                    yield item
+        finally:
+            producer.cancel()
+
+    async def list_coursework_bulk(
+        self,
+        course_ids: list[str],
+        concurrency: int = 10,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Lista coursework de vários cursos em paralelo
+
+        Args:
+            course_ids: IDs dos cursos
+            concurrency: Máximo de requisições simultâneas
+
+        Returns:
+            Dict course_id -> resultado de list_coursework
+        """
+        return await self._gather_by_course(self.list_coursework, course_ids, concurrency)
+
+    async def list_course_materials_bulk(
+        self,
+        course_ids: list[str],
+        concurrency: int = 10,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Lista materiais de vários cursos em paralelo
+
+        Args:
+            course_ids: IDs dos cursos
+            concurrency: Máximo de requisições simultâneas
+
+        Returns:
+            Dict course_id -> resultado de list_course_materials
+        """
+        return await self._gather_by_course(
+            self.list_course_materials, course_ids, concurrency
+        )
+
+    async def _gather_by_course(
+        self,
+        fetch: Callable[[str], Awaitable[dict[str, Any]]],
+        course_ids: list[str],
+        concurrency: int,
+    ) -> dict[str, dict[str, Any]]:
+        """Executa fetch para cada curso com no máximo `concurrency` em voo"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(course_id: str) -> tuple[str, dict[str, Any]]:
+            async with semaphore:
+                return course_id, await fetch(course_id)
+
+        return dict(await asyncio.gather(*(fetch_one(c) for c in course_ids)))
+
     def extract_video_links(
         self,
         coursework_or_material: dict[str, Any],
-    ) -> list[dict[str, Any]]:
+    ) -> Iterator[dict[str, Any]]:
         """
         Extrai links de vídeos de materiais/atividades
 
         Args:
             coursework_or_material: Dados do material
 
-        Returns:
-            Lista de dicts com info dos vídeos
+        Yields:
+            Dicts com info dos vídeos, um por vez
         """
-        video_links = []
-
         # Verificar descrição
         description = coursework_or_material.get("description", "")
         if description:
-            video_links.extend(self._extract_urls_from_text(description))
+            yield from self._extract_urls_from_text(description)
 
         # Verificar materiais anexos
         materials = coursework_or_material.get("materials", [])
@@ -167,12 +393,12 @@ class GoogleClassroomSimpleService:
             # YouTube
             if "youtubeVideo" in material:
                 youtube = material["youtubeVideo"]
-                video_links.append({
+                yield {
                     "url": f"https://www.youtube.com/watch?v={youtube['id']}",
                     "title": youtube.get("title"),
                     "source_type": "youtube",
                     "video_id": youtube["id"],
-                })
+                }
 
             # Google Drive
             elif "driveFile" in material:
@@ -181,64 +407,44 @@ class GoogleClassroomSimpleService:
                 mime_type = drive_file.get("mimeType", "")
 
                 if mime_type.startswith("video/"):
-                    video_links.append({
+                    yield {
                         "url": f"https://drive.google.com/file/d/{file_id}/view",
                         "title": drive_file.get("title"),
                         "source_type": "drive",
                         "drive_file_id": file_id,
                         "drive_mime_type": mime_type,
-                    })
+                    }
 
             # Link genérico
             elif "link" in material:
                 link = material["link"]
                 url = link.get("url", "")
                 if self._is_video_url(url):
-                    video_links.append({
+                    yield {
                         "url": url,
                         "title": link.get("title"),
                         "source_type": self._detect_video_source(url),
-                    })
-
-        return video_links
+                    }
 
-    def _extract_urls_from_text(self, text: str) -> list[dict[str, Any]]:
+    def _extract_urls_from_text(self, text: str) -> Iterator[dict[str, Any]]:
         """Extrai URLs de vídeo do texto"""
-        video_links = []
-        url_pattern = r"https?://[^\s<>\"']+"
-        urls = re.findall(url_pattern, text)
-
-        for url in urls:
-            if self._is_video_url(url):
-                video_links.append({
-                    "url": url,
+        # Uma passada: extrai e classifica cada URL uma única vez
+        for match in _URL_RE.finditer(text):
+            source = _video_source(match.group(0))
+            if source:
+                yield {
+                    "url": match.group(0),
                     "title": None,
-                    "source_type": self._detect_video_source(url),
-                })
-
-        return video_links
+                    "source_type": source,
+                }
 
     def _is_video_url(self, url: str) -> bool:
         """Verifica se URL é de vídeo"""
-        video_domains = [
-            "youtube.com", "youtu.be",
-            "drive.google.com",
-            "vimeo.com",
-            "dailymotion.com",
-        ]
-        return any(domain in url.lower() for domain in video_domains)
+        return _video_source(url) is not None
 
     def _detect_video_source(self, url: str) -> str:
         """Detecta a fonte do vídeo pela URL"""
-        url_lower = url.lower()
-        if "youtube.com" in url_lower or "youtu.be" in url_lower:
-            return "youtube"
-        elif "drive.google.com" in url_lower:
-            return "drive"
-        elif "vimeo.com" in url_lower:
-            return "vimeo"
-        else:
-            return "other"
+        return _video_source(url) or "other"
 
 
 def create_classroom_service() -> GoogleClassroomSimpleService:
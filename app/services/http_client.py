@@ -24,7 +24,6 @@ class GoogleHTTPClient:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36",
             "Accept": "application/json, text/plain, */*",
             "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
             "Referer": "https://classroom.google.com/",
             "Origin": "https://classroom.google.com",
             "Sec-Fetch-Dest": "empty",
@@ -32,6 +31,17 @@ class GoogleHTTPClient:
             "Sec-Fetch-Site": "same-origin",
         }
 
+        # Long-lived client: reuses TCP/TLS connections across requests and
+        # multiplexes concurrent calls over HTTP/2. Accept-Encoding is left to
+        # httpx, which advertises br only when brotli is installed.
+        self._client = httpx.AsyncClient(
+            cookies=self.cookies,
+            headers=self.headers,
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+
     async def get(
         self,
         url: str,
@@ -49,15 +59,10 @@ class GoogleHTTPClient:
         Returns:
             httpx Response
         """
-        async with httpx.AsyncClient(cookies=self.cookies, timeout=30.0) as client:
-            response = await client.get(
-                url,
-                params=params,
-                headers=self.headers,
-                **kwargs,
-            )
-            response.raise_for_status()
-            return response
+        response = await self._client.get(url, params=params, **kwargs)
+        logger.debug(f"GET {url} via {response.http_version}")
+        response.raise_for_status()
+        return response
 
     async def post(
         self,
@@ -78,16 +83,13 @@ class GoogleHTTPClient:
         Returns:
             httpx Response
         """
-        async with httpx.AsyncClient(cookies=self.cookies, timeout=30.0) as client:
-            response = await client.post(
-                url,
-                json=json,
-                data=data,
-                headers=self.headers,
-                **kwargs,
-            )
-            response.raise_for_status()
-            return response
+        response = await self._client.post(url, json=json, data=data, **kwargs)
+        response.raise_for_status()
+        return response
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool"""
+        await self._client.aclose()
 
 
 # Singleton
@@ -105,3 +107,13 @@ def get_http_client() -> GoogleHTTPClient:
     if _http_client is None:
         _http_client = GoogleHTTPClient()
     return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the singleton HTTP client if it was created
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -3,8 +3,12 @@ Video downloader service using yt-dlp
 """
 import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 from typing import Any, Callable, Optional
+from urllib.parse import urlparse
 
 import yt_dlp
 from tenacity import (
@@ -19,6 +23,60 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# YoutubeDL instances kept per pool thread (one per option set, e.g. course dir)
+YDL_CACHE_MAX_PER_THREAD = 8
+
+# Video hosts whose URLs are handled by extractors indexed under another host
+_HOST_ALIASES = {
+    "youtu.be": "youtube.com",
+    "youtube-nocookie.com": "youtube.com",
+    "youtube.googleapis.com": "youtube.com",
+    "docs.google.com": "drive.google.com",
+    "drive.usercontent.google.com": "drive.google.com",
+    "wistia.com": "fast.wistia.com",
+}
+
+
+def _url_host(url: str) -> Optional[str]:
+    """Hostname of a URL without the "www." prefix, or None"""
+    try:
+        host = urlparse(url).hostname
+    except ValueError:
+        return None
+    return host.removeprefix("www.") if host else None
+
+
+@cache
+def _extractor_index() -> dict[str, list[type]]:
+    """
+    Bucket yt-dlp extractors by the hosts of their test URLs
+
+    Built once per process, so is_supported_url only runs suitable() on the
+    few extractors for a URL's host instead of all of them. The generic
+    extractor (which accepts any URL) is left out; hosts in _HOST_ALIASES
+    also get the extractors of the host they alias.
+
+    Returns:
+        Dictionary of host -> extractor classes
+    """
+    by_host: dict[str, list[type]] = {}
+
+    for extractor in yt_dlp.extractor.gen_extractor_classes():
+        if extractor.ie_key() == "Generic":
+            continue
+        hosts = {
+            host
+            for test in extractor.get_testcases(True)
+            if (host := _url_host(test.get("url", "")))
+        }
+        for host in hosts:
+            by_host.setdefault(host, []).append(extractor)
+
+    for alias, host in _HOST_ALIASES.items():
+        by_host[alias] = by_host.get(alias, []) + by_host.get(host, [])
+
+    return by_host
+
 
 class DownloadProgress:
     """Progress tracker for video downloads"""
@@ -30,6 +88,8 @@ class DownloadProgress:
         self.status: str = "pending"
         self.filename: Optional[str] = None
         self.error: Optional[str] = None
+        # Set from another thread to abort the download at the next hook
+        self.cancelled: bool = False
 
 
 class VideoDownloaderService:
@@ -39,6 +99,16 @@ class VideoDownloaderService:
         self.download_dir = settings.download_path
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
+        # Dedicated pool for blocking yt-dlp calls, sized to the worker
+        self._pool = ThreadPoolExecutor(
+            max_workers=settings.max_concurrent_downloads,
+            thread_name_prefix="ytdlp",
+        )
+        # Per-thread YoutubeDL instances (YoutubeDL is not thread-safe)
+        self._ydl_local = threading.local()
+        self._ydl_instances: list[yt_dlp.YoutubeDL] = []
+        self._ydl_lock = threading.Lock()
+
     def _get_yt_dlp_options(
         self,
         output_path: Path,
@@ -66,17 +136,22 @@ class VideoDownloaderService:
             "fragment_retries": settings.worker_max_retries,
             "socket_timeout": 30,
             "http_chunk_size": 10485760,  # 10MB
+            "concurrent_fragment_downloads": settings.ytdlp_concurrent_fragments,
             # Output options
             "writeinfojson": False,
             "writethumbnail": False,
             "writedescription": False,
             "writesubtitles": False,
             "writeautomaticsub": False,
-            # Post-processing
+            # Post-processing (remux is a stream copy; mp4 sources are untouched)
             "merge_output_format": "mp4",
             "postprocessors": [
                 {
-                    "key": "FFmpegVideoConvertor",
+                    "key": (
+                        "FFmpegVideoConvertor"
+                        if settings.ytdlp_force_transcode
+                        else "FFmpegVideoRemuxer"
+                    ),
                     "preferedformat": "mp4",
                 }
             ],
@@ -94,7 +169,13 @@ class VideoDownloaderService:
         Args:
             d: Progress dictionary from yt-dlp
             progress: DownloadProgress object to update
+
+        Raises:
+            yt_dlp.utils.DownloadCancelled: If the download was cancelled
         """
+        if progress.cancelled:
+            raise yt_dlp.utils.DownloadCancelled()
+
         if d["status"] == "downloading":
             progress.status = "downloading"
             progress.downloaded_bytes = d.get("downloaded_bytes", 0)
@@ -132,6 +213,7 @@ class VideoDownloaderService:
         url: str,
         output_subdir: Optional[str] = None,
         progress_callback: Optional[Callable[[DownloadProgress], None]] = None,
+        progress: Optional[DownloadProgress] = None,
     ) -> tuple[bool, Optional[Path], Optional[str]]:
         """
         Download a video from URL
@@ -140,6 +222,7 @@ class VideoDownloaderService:
             url: Video URL to download
             output_subdir: Optional subdirectory for output
             progress_callback: Optional callback function for progress updates
+            progress: Optional progress tracker (pass one to be able to cancel)
 
         Returns:
             Tuple of (success, output_path, error_message)
@@ -152,7 +235,8 @@ class VideoDownloaderService:
                 output_path.mkdir(parents=True, exist_ok=True)
 
             # Setup progress tracking
-            progress = DownloadProgress()
+            if progress is None:
+                progress = DownloadProgress()
 
             def yt_dlp_hook(d: dict[str, Any]) -> None:
                 self._progress_hook(d, progress)
@@ -163,9 +247,9 @@ class VideoDownloaderService:
             ydl_opts = self._get_yt_dlp_options(output_path, yt_dlp_hook)
 
             # Download video in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
-                None,
+                self._pool,
                 self._download_sync,
                 url,
                 ydl_opts,
@@ -186,6 +270,10 @@ class VideoDownloaderService:
             logger.info(f"Successfully downloaded: {url} -> {output_file}")
             return True, output_file, None
 
+        except yt_dlp.utils.DownloadCancelled:
+            logger.info(f"Download cancelled: {url}")
+            return False, None, "Download cancelled"
+
         except yt_dlp.utils.DownloadError as e:
             error_msg = f"yt-dlp download error: {str(e)}"
             logger.error(error_msg)
@@ -204,8 +292,49 @@ class VideoDownloaderService:
             url: Video URL
             ydl_opts: yt-dlp options
         """
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        # Progress hooks are per download; the rest of the options are cached
+        options = {k: v for k, v in ydl_opts.items() if k != "progress_hooks"}
+        ydl = self._get_ydl(options)
+        ydl._progress_hooks = list(ydl_opts.get("progress_hooks", []))
+        try:
             ydl.download([url])
+        finally:
+            ydl._progress_hooks = []
+
+    def _get_ydl(self, ydl_opts: dict[str, Any]) -> yt_dlp.YoutubeDL:
+        """
+        Get this thread's YoutubeDL instance for an option set
+
+        Creating a YoutubeDL parses options and loads extractors, so
+        instances are reused across calls. Each thread keeps at most
+        YDL_CACHE_MAX_PER_THREAD of them, closing the least recently used.
+
+        Args:
+            ydl_opts: yt-dlp options (without progress hooks)
+
+        Returns:
+            YoutubeDL instance owned by the current thread
+        """
+        instances = getattr(self._ydl_local, "instances", None)
+        if instances is None:
+            instances = self._ydl_local.instances = {}
+
+        key = repr(sorted(ydl_opts.items()))
+        ydl = instances.pop(key, None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(ydl_opts)
+            with self._ydl_lock:
+                self._ydl_instances.append(ydl)
+
+            if len(instances) >= YDL_CACHE_MAX_PER_THREAD:
+                oldest = instances.pop(next(iter(instances)))
+                with self._ydl_lock:
+                    self._ydl_instances.remove(oldest)
+                oldest.close()
+
+        # Re-insert to keep the dict in least-recently-used order
+        instances[key] = ydl
+        return ydl
 
     async def get_video_info(self, url: str) -> Optional[dict[str, Any]]:
         """
@@ -224,9 +353,9 @@ class VideoDownloaderService:
                 "extract_flat": False,
             }
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             info = await loop.run_in_executor(
-                None,
+                self._pool,
                 self._extract_info_sync,
                 url,
                 ydl_opts,
@@ -242,6 +371,9 @@ class VideoDownloaderService:
         """
         Synchronous info extraction to run in thread pool
 
+        Reuses a YoutubeDL instance per thread and option set, since
+        creating one loads the extractors on every call.
+
         Args:
             url: Video URL
             ydl_opts: yt-dlp options
@@ -249,13 +381,15 @@ class VideoDownloaderService:
         Returns:
             Video information dictionary
         """
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            return ydl.extract_info(url, download=False)
+        return self._get_ydl(ydl_opts).extract_info(url, download=False)
 
     def is_supported_url(self, url: str) -> bool:
         """
         Check if URL is supported by yt-dlp
 
+        Only the extractors indexed under the URL's host and its parent
+        domains are tried; hosts that aren't indexed are unsupported.
+
         Args:
             url: Video URL
 
@@ -263,15 +397,40 @@ class VideoDownloaderService:
             True if URL is supported
         """
         try:
-            extractors = yt_dlp.extractor.gen_extractors()
-            for extractor in extractors:
-                if extractor.suitable(url):
+            host = _url_host(url)
+            by_host = _extractor_index()
+
+            # Probe the host and its parent domains (m.youtube.com -> youtube.com)
+            while host:
+                if any(extractor.suitable(url) for extractor in by_host.get(host, ())):
                     return True
+                _, _, host = host.partition(".")
+
             return False
         except Exception as e:
             logger.error(f"Error checking URL support: {e}")
             return False
 
+    def cancel(self, progress: DownloadProgress) -> None:
+        """
+        Cancel a running download
+
+        The yt-dlp thread stops at its next progress hook.
+
+        Args:
+            progress: Progress tracker passed to download_video
+        """
+        progress.cancelled = True
+
+    def close(self) -> None:
+        """Shut down the yt-dlp thread pool and close cached YoutubeDL instances"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+        with self._ydl_lock:
+            instances, self._ydl_instances = self._ydl_instances, []
+        for ydl in instances:
+            ydl.close()
+
 
 # Singleton instance
 _video_downloader: Optional[VideoDownloaderService] = None
@@ -288,3 +447,13 @@ def get_video_downloader() -> VideoDownloaderService:
     if _video_downloader is None:
         _video_downloader = VideoDownloaderService()
     return _video_downloader
+
+
+def close_video_downloader() -> None:
+    """
+    Close the singleton video downloader if it was created
+    """
+    global _video_downloader
+    if _video_downloader is not None:
+        _video_downloader.close()
+        _video_downloader = None
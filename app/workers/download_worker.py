@@ -3,6 +3,7 @@ Background worker for processing video download jobs
 """
 import asyncio
 import logging
+import time
 from pathlib import Path
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,6 +18,12 @@ from app.services.video_downloader import DownloadProgress, get_video_downloader
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Minimum interval between progress writes when the percentage is unchanged
+PROGRESS_UPDATE_INTERVAL_SECONDS = 1.0
+
+# Characters not allowed in file/directory names, mapped to "_"
+_INVALID_FILENAME_CHARS = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
 
 class DownloadWorker:
     """Worker for processing video download jobs"""
@@ -26,6 +33,8 @@ class DownloadWorker:
         self.video_downloader = get_video_downloader()
         self.running = False
         self.current_jobs: set[int] = set()
+        # Progress trackers of running downloads, used to cancel them
+        self._progress: dict[int, DownloadProgress] = {}
 
     async def start(self):
         """
@@ -45,47 +54,55 @@ class DownloadWorker:
                 await asyncio.sleep(settings.worker_poll_interval_seconds)
 
     async def stop(self):
-        """Stop the worker"""
+        """
+        Stop the worker
+
+        Cancels running downloads (they go back to pending) and waits up to
+        worker_shutdown_timeout_seconds for them to finish
+        """
         self.running = False
+
+        for progress in self._progress.values():
+            self.video_downloader.cancel(progress)
+
+        deadline = time.monotonic() + settings.worker_shutdown_timeout_seconds
+        while self.current_jobs and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+
+        if self.current_jobs:
+            logger.warning(
+                f"Download worker stopped with {len(self.current_jobs)} jobs still running"
+            )
         logger.info("Download worker stopped")
 
     async def _process_pending_jobs(self):
         """
         Process pending download jobs
 
-        Fetches pending jobs and starts downloads up to max_concurrent_downloads
+        Atomically claims pending jobs (marking them as downloading) and
+        starts downloads up to max_concurrent_downloads
         """
-        async with get_db_context() as db:
-            download_job_repo = DownloadJobRepository(db)
+        # Calculate available slots
+        available_slots = settings.max_concurrent_downloads - len(self.current_jobs)
 
-            # Get pending jobs
-            pending_jobs = await download_job_repo.get_by_status(
-                DownloadStatus.PENDING,
-                skip=0,
-                limit=settings.max_concurrent_downloads,
-            )
-
-            # Filter out jobs already being processed
-            jobs_to_process = [
-                job for job in pending_jobs
-                if job.id not in self.current_jobs
-            ]
+        if available_slots <= 0:
+            return
 
-            # Calculate available slots
-            available_slots = settings.max_concurrent_downloads - len(self.current_jobs)
+        async with get_db_context() as db:
+            download_job_repo = DownloadJobRepository(db)
 
-            if available_slots <= 0:
-                return
+            # Claim jobs in one transaction (SKIP LOCKED keeps workers apart)
+            jobs = await download_job_repo.claim_pending(available_slots)
+            await db.commit()
 
-            # Process jobs up to available slots
-            for job in jobs_to_process[:available_slots]:
-                # Mark as being processed
-                self.current_jobs.add(job.id)
+        for job in jobs:
+            # Mark as being processed
+            self.current_jobs.add(job.id)
 
-                # Start download in background
-                asyncio.create_task(self._process_download_job(job.id))
+            # Start download in background
+            asyncio.create_task(self._process_download_job(job.id))
 
-                logger.info(f"Started processing download job {job.id}")
+            logger.info(f"Started processing download job {job.id}")
 
     async def _process_download_job(self, job_id: int):
         """
@@ -110,43 +127,71 @@ class DownloadWorker:
                 video_url = job_data["video_url"]
                 course_name = job_data["course_name"]
 
-                # Update status to downloading
-                await download_job_repo.update_status(
-                    job_id,
-                    DownloadStatus.DOWNLOADING,
-                )
-                await db.commit()
+                # Read now: a failed progress commit rolls back this session,
+                # which expires job, and lazy loads raise under asyncio
+                video_link_id = job.video_link_id
+                retry_count = job.retry_count
 
                 logger.info(f"Downloading video from: {video_url}")
 
                 # Create subdirectory for course
                 course_subdir = self._sanitize_filename(course_name)
 
-                # Progress callback
-                async def progress_callback(progress: DownloadProgress):
-                    """Update job progress in database"""
-                    try:
-                        async with get_db_context() as progress_db:
-                            progress_repo = DownloadJobRepository(progress_db)
-                            await progress_repo.update_progress(
-                                job_id,
-                                progress.progress_percent,
-                                progress.downloaded_bytes,
-                                progress.total_bytes,
-                            )
-                            await progress_db.commit()
-                    except Exception as e:
-                        logger.error(f"Failed to update progress: {e}")
+                # Progress callback (runs in the yt-dlp thread): debounce and
+                # hand updates to the event loop instead of writing directly
+                loop = asyncio.get_running_loop()
+                progress_queue: asyncio.Queue = asyncio.Queue()
+                last_update = 0.0
+                last_percent = -1
+
+                def progress_callback(progress: DownloadProgress):
+                    """Queue a progress update at most once per second or percent"""
+                    nonlocal last_update, last_percent
+                    now = time.monotonic()
+                    if (
+                        now - last_update < PROGRESS_UPDATE_INTERVAL_SECONDS
+                        and progress.progress_percent == last_percent
+                    ):
+                        return
+                    last_update = now
+                    last_percent = progress.progress_percent
+                    loop.call_soon_threadsafe(
+                        progress_queue.put_nowait,
+                        (
+                            progress.progress_percent,
+                            progress.downloaded_bytes,
+                            progress.total_bytes,
+                        ),
+                    )
 
-                # Download video
-                success, output_path, error_message = await self.video_downloader.download_video(
-                    url=video_url,
-                    output_subdir=course_subdir,
-                    progress_callback=progress_callback,
+                progress_writer = asyncio.create_task(
+                    self._write_progress_updates(db, job_id, progress_queue)
                 )
+                progress = self._progress[job_id] = DownloadProgress()
+
+                # Download video
+                try:
+                    success, output_path, error_message = (
+                        await self.video_downloader.download_video(
+                            url=video_url,
+                            output_subdir=course_subdir,
+                            progress_callback=progress_callback,
+                            progress=progress,
+                        )
+                    )
+                finally:
+                    # Flush pending progress before the session is used again
+                    progress_queue.put_nowait(None)
+                    await progress_writer
 
                 # Update job status
-                if success and output_path:
+                if progress.cancelled:
+                    # Cancelled by shutdown: resume on next start, no retry used
+                    await download_job_repo.update_status(job_id, DownloadStatus.PENDING)
+                    await db.commit()
+                    logger.info(f"Download job {job_id} cancelled, reset to pending")
+
+                elif success and output_path:
                     # Mark job as completed
                     await download_job_repo.update(
                         job_id,
@@ -158,7 +203,7 @@ class DownloadWorker:
 
                     # Mark video link as downloaded
                     await video_link_repo.mark_as_downloaded(
-                        job.video_link_id,
+                        video_link_id,
                         str(output_path),
                         output_path.stat().st_size,
                     )
@@ -168,7 +213,7 @@ class DownloadWorker:
 
                 else:
                     # Check if should retry
-                    if job.retry_count < settings.worker_max_retries:
+                    if retry_count < settings.worker_max_retries:
                         # Increment retry and reset to pending
                         await download_job_repo.increment_retry_count(job_id)
                         await download_job_repo.update_status(
@@ -178,7 +223,8 @@ class DownloadWorker:
                         )
                         await db.commit()
                         logger.warning(
-                            f"Download job {job_id} failed, retry {job.retry_count + 1}/{settings.worker_max_retries}"
+                            f"Download job {job_id} failed, "
+                            f"retry {retry_count + 1}/{settings.worker_max_retries}"
                         )
                     else:
                         # Mark as failed
@@ -208,8 +254,52 @@ class DownloadWorker:
 
         finally:
             # Remove from current jobs
+            self._progress.pop(job_id, None)
             self.current_jobs.discard(job_id)
 
+    async def _write_progress_updates(
+        self,
+        db: AsyncSession,
+        job_id: int,
+        progress_queue: asyncio.Queue,
+    ):
+        """
+        Persist queued progress updates until a None sentinel is received
+
+        Updates queued while a write is in flight are coalesced, so only the
+        latest one is written, in a single commit on the job's session.
+
+        Args:
+            db: Database session of the job being downloaded
+            job_id: Download job ID
+            progress_queue: Queue of (percent, downloaded_bytes, total_bytes)
+        """
+        download_job_repo = DownloadJobRepository(db)
+        done = False
+
+        while not done:
+            updates = [await progress_queue.get()]
+            while not progress_queue.empty():
+                updates.append(progress_queue.get_nowait())
+
+            done = None in updates
+            updates = [update for update in updates if update is not None]
+            if not updates:
+                continue
+
+            percent, downloaded_bytes, total_bytes = updates[-1]
+            try:
+                await download_job_repo.update_progress(
+                    job_id,
+                    percent,
+                    downloaded_bytes,
+                    total_bytes,
+                )
+                await db.commit()
+            except Exception as e:
+                logger.error(f"Failed to update progress: {e}")
+                await db.rollback()
+
     def _sanitize_filename(self, filename: str) -> str:
         """
         Sanitize filename for safe filesystem usage
@@ -220,17 +310,8 @@ class DownloadWorker:
         Returns:
             Sanitized filename
         """
-        # Remove invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, "_")
-
-        # Limit length
-        max_length = 100
-        if len(filename) > max_length:
-            filename = filename[:max_length]
-
-        return filename
+        # Replace invalid characters in one pass and limit length
+        return filename.translate(_INVALID_FILENAME_CHARS)[:100]
 
 
 # Global worker instance
@@ -2,109 +2,133 @@
 """
 Script para verificar se você tem todos os cookies necessários
 """
+import os
+import sys
 from pathlib import Path
 
 from app.services.cookie_manager import get_cookie_manager
 
+# Traceback completo só com CLASSROOM_DEBUG=1
+_DEBUG = os.environ.get("CLASSROOM_DEBUG") == "1"
+
+# Essential cookies
+ESSENTIAL_COOKIES = {
+    "SID": "Session ID - Identifica sua sessão Google",
+    "HSID": "Host Session ID - Sessão específica do host",
+    "SSID": "Secure Session ID - Versão segura da sessão",
+    "APISID": "API Session ID - Acesso às APIs",
+    "SAPISID": "Secure API Session ID - Acesso seguro às APIs",
+}
+
+# Recommended cookies
+RECOMMENDED_COOKIES = {
+    "__Secure-1PSID": "Secure Session ID (primary)",
+    "__Secure-3PSID": "Secure Session ID (cross-site)",
+    "__Secure-1PAPISID": "Secure API ID (primary)",
+    "__Secure-3PAPISID": "Secure API ID (cross-site)",
+}
+
+# Optional cookies
+OPTIONAL_COOKIES = {
+    "__Secure-1PSIDTS": "Session timestamp",
+    "__Secure-3PSIDTS": "Session timestamp (cross-site)",
+    "SIDCC": "Session cookie consent",
+}
+
+ESSENTIAL_KEYS = frozenset(ESSENTIAL_COOKIES)
+RECOMMENDED_KEYS = frozenset(RECOMMENDED_COOKIES)
+
+# Templates das linhas do relatório (format pré-ligado, reutilizado por cookie)
+_FMT_ESSENTIAL_OK = "   ✅ {name:15} - {desc}".format
+_FMT_ESSENTIAL_MISSING = "   ❌ {name:15} - {desc} - NÃO ENCONTRADO".format
+_FMT_VALUE = "      Valor: {value:.50}...".format
+_FMT_OK = "   ✅ {name:20} - {desc}".format
+_FMT_RECOMMENDED_MISSING = "   ⚠️  {name:20} - {desc} - Não encontrado".format
+_FMT_OPTIONAL_MISSING = "   ⚪ {name:20} - {desc} - Não encontrado".format
+
 
 def main():
     """Check if all required cookies are present"""
-    print("\n" + "=" * 70)
-    print("🔍 VERIFICAR COOKIES")
-    print("=" * 70 + "\n")
+    # Output is collected and written once at the end
+    lines = ["", "=" * 70, "🔍 VERIFICAR COOKIES", "=" * 70, ""]
+
+    try:
+        _check(lines)
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 
+def _check(lines: list[str]) -> None:
+    """Append the cookie report to lines"""
     cookie_manager = get_cookie_manager()
 
     # Check if cookies file exists
     if not cookie_manager.has_cookies():
-        print("❌ Cookies não encontrados!")
-        print(f"📁 Esperado em: {cookie_manager.cookies_file.absolute()}")
-        print("\n💡 Execute primeiro: python import_cookies.py")
+        lines.append("❌ Cookies não encontrados!")
+        lines.append(f"📁 Esperado em: {cookie_manager.cookies_file.absolute()}")
+        lines.append("\n💡 Execute primeiro: python import_cookies.py")
         return
 
     # Load cookies
     cookies = cookie_manager.load_cookies()
 
     if not cookies:
-        print("❌ Erro ao carregar cookies!")
+        lines.append("❌ Erro ao carregar cookies!")
         return
 
-    print(f"✅ Cookies carregados: {len(cookies)} cookies\n")
-
-    # Essential cookies
-    essential_cookies = {
-        "SID": "Session ID - Identifica sua sessão Google",
-        "HSID": "Host Session ID - Sessão específica do host",
-        "SSID": "Secure Session ID - Versão segura da sessão",
-        "APISID": "API Session ID - Acesso às APIs",
-        "SAPISID": "Secure API Session ID - Acesso seguro às APIs",
-    }
-
-    # Recommended cookies
-    recommended_cookies = {
-        "__Secure-1PSID": "Secure Session ID (primary)",
-        "__Secure-3PSID": "Secure Session ID (cross-site)",
-        "__Secure-1PAPISID": "Secure API ID (primary)",
-        "__Secure-3PAPISID": "Secure API ID (cross-site)",
-    }
-
-    # Optional cookies
-    optional_cookies = {
-        "__Secure-1PSIDTS": "Session timestamp",
-        "__Secure-3PSIDTS": "Session timestamp (cross-site)",
-        "SIDCC": "Session cookie consent",
-    }
+    lines.append(f"✅ Cookies carregados: {len(cookies)} cookies\n")
+
+    # Missing cookies by set difference (order kept for the report)
+    missing_essential_keys = ESSENTIAL_KEYS - cookies.keys()
+    missing_recommended_keys = RECOMMENDED_KEYS - cookies.keys()
+    missing_essential = [c for c in ESSENTIAL_COOKIES if c in missing_essential_keys]
+    missing_recommended = [c for c in RECOMMENDED_COOKIES if c in missing_recommended_keys]
 
     # Check essential
-    print("🔑 COOKIES ESSENCIAIS:")
-    missing_essential = []
-    for cookie_name, description in essential_cookies.items():
-        if cookie_name in cookies:
-            value = cookies[cookie_name]
-            print(f"   ✅ {cookie_name:15} - {description}")
-            print(f"      Valor: {value[:50]}...")
+    lines.append("🔑 COOKIES ESSENCIAIS:")
+    for cookie_name, description in ESSENTIAL_COOKIES.items():
+        if cookie_name in missing_essential_keys:
+            lines.append(_FMT_ESSENTIAL_MISSING(name=cookie_name, desc=description))
         else:
-            print(f"   ❌ {cookie_name:15} - {description} - NÃO ENCONTRADO")
-            missing_essential.append(cookie_name)
+            lines.append(_FMT_ESSENTIAL_OK(name=cookie_name, desc=description))
+            lines.append(_FMT_VALUE(value=cookies[cookie_name]))
 
     # Check recommended
-    print("\n📋 COOKIES RECOMENDADOS:")
-    missing_recommended = []
-    for cookie_name, description in recommended_cookies.items():
-        if cookie_name in cookies:
-            print(f"   ✅ {cookie_name:20} - {description}")
+    lines.append("\n📋 COOKIES RECOMENDADOS:")
+    for cookie_name, description in RECOMMENDED_COOKIES.items():
+        if cookie_name in missing_recommended_keys:
+            lines.append(_FMT_RECOMMENDED_MISSING(name=cookie_name, desc=description))
         else:
-            print(f"   ⚠️  {cookie_name:20} - {description} - Não encontrado")
-            missing_recommended.append(cookie_name)
+            lines.append(_FMT_OK(name=cookie_name, desc=description))
 
     # Check optional
-    print("\n🔧 COOKIES OPCIONAIS:")
-    for cookie_name, description in optional_cookies.items():
+    lines.append("\n🔧 COOKIES OPCIONAIS:")
+    for cookie_name, description in OPTIONAL_COOKIES.items():
         if cookie_name in cookies:
-            print(f"   ✅ {cookie_name:20} - {description}")
+            lines.append(_FMT_OK(name=cookie_name, desc=description))
         else:
-            print(f"   ⚪ {cookie_name:20} - {description} - Não encontrado")
+            lines.append(_FMT_OPTIONAL_MISSING(name=cookie_name, desc=description))
 
     # Summary
-    print("\n" + "=" * 70)
+    lines.append("\n" + "=" * 70)
     if missing_essential:
-        print("❌ ATENÇÃO: Cookies essenciais faltando!")
-        print(f"   Faltando: {', '.join(missing_essential)}")
-        print("\n💡 Solução:")
-        print("   1. Acesse Google Classroom no navegador")
-        print("   2. Faça login")
-        print("   3. F12 → Network → Copie um request como cURL")
-        print("   4. Cole em requests_classrom.txt")
-        print("   5. Execute: python import_cookies.py")
+        lines.append("❌ ATENÇÃO: Cookies essenciais faltando!")
+        lines.append(f"   Faltando: {', '.join(missing_essential)}")
+        lines.append("\n💡 Solução:")
+        lines.append("   1. Acesse Google Classroom no navegador")
+        lines.append("   2. Faça login")
+        lines.append("   3. F12 → Network → Copie um request como cURL")
+        lines.append("   4. Cole em requests_classrom.txt")
+        lines.append("   5. Execute: python import_cookies.py")
     elif missing_recommended:
-        print("⚠️  Cookies essenciais OK, mas alguns recomendados estão faltando")
-        print(f"   Faltando: {', '.join(missing_recommended)}")
-        print("\n💡 A API deve funcionar, mas pode ter problemas em alguns casos")
+        lines.append("⚠️  Cookies essenciais OK, mas alguns recomendados estão faltando")
+        lines.append(f"   Faltando: {', '.join(missing_recommended)}")
+        lines.append("\n💡 A API deve funcionar, mas pode ter problemas em alguns casos")
     else:
-        print("✅ TODOS OS COOKIES IMPORTANTES ENCONTRADOS!")
-        print("\n🎉 Sua autenticação está configurada corretamente!")
+        lines.append("✅ TODOS OS COOKIES IMPORTANTES ENCONTRADOS!")
+        lines.append("\n🎉 Sua autenticação está configurada corretamente!")
 
-    print("=" * 70 + "\n")
+    lines.append("=" * 70 + "\n")
 
 
 if __name__ == "__main__":
@@ -112,5 +136,6 @@ if __name__ == "__main__":
         main()
     except Exception as e:
         print(f"\n❌ Erro: {e}")
-        import traceback
-        traceback.print_exc()
+        if _DEBUG:
+            import traceback
+            traceback.print_exc()
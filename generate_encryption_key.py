@@ -2,12 +2,14 @@
 """
 Script to generate Fernet encryption key for storing Google OAuth2 credentials
 """
-from cryptography.fernet import Fernet
+import base64
+import secrets
 
 
 def main():
     """Generate and print a new Fernet encryption key"""
-    key = Fernet.generate_key()
+    # Same as Fernet.generate_key(), without importing cryptography
+    key = base64.urlsafe_b64encode(secrets.token_bytes(32))
     print("\n" + "=" * 70)
     print("🔐 ENCRYPTION KEY GERADA COM SUCESSO!")
     print("=" * 70)
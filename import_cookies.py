@@ -2,10 +2,14 @@
 """
 Script para importar cookies dos arquivos de requests do navegador
 """
+import os
 from pathlib import Path
 
 from app.services.cookie_manager import get_cookie_manager
 
+# Traceback completo só com CLASSROOM_DEBUG=1
+_DEBUG = os.environ.get("CLASSROOM_DEBUG") == "1"
+
 
 def main():
     """Import cookies from curl files"""
@@ -19,6 +23,9 @@ def main():
     classroom_file = Path("requests_classrom.txt")
     drive_file = Path("requests_drive.txt")
 
+    # Um único getcwd() para todos os caminhos exibidos
+    cwd = Path.cwd()
+
     all_cookies = {}
 
     # Parse classroom cookies
@@ -42,8 +49,8 @@ def main():
     if not all_cookies:
         print("\n❌ Nenhum cookie encontrado!")
         print("\nVerifique se os arquivos existem:")
-        print(f"  - {classroom_file.absolute()}")
-        print(f"  - {drive_file.absolute()}")
+        print(f"  - {cwd / classroom_file}")
+        print(f"  - {cwd / drive_file}")
         return
 
     # Save cookies
@@ -51,7 +58,7 @@ def main():
     cookie_manager.save_cookies(all_cookies)
 
     print("\n✅ Cookies importados com sucesso!")
-    print(f"📁 Salvos em: {cookie_manager.cookies_file.absolute()}")
+    print(f"📁 Salvos em: {cwd / cookie_manager.cookies_file}")
 
     # Show important cookies
     important_cookies = ["SID", "HSID", "SSID", "APISID", "SAPISID"]
@@ -73,5 +80,6 @@ if __name__ == "__main__":
         main()
     except Exception as e:
         print(f"\n❌ Erro: {e}")
-        import traceback
-        traceback.print_exc()
+        if _DEBUG:
+            import traceback
+            traceback.print_exc()
@@ -2,11 +2,18 @@
 """
 Setup script para configurar o projeto rapidamente
 """
+import base64
 import os
+import re
+import secrets
 import sys
 from pathlib import Path
 
-from cryptography.fernet import Fernet
+_PLACEHOLDER_RE = re.compile(r"SUBSTITUA_PELA_CHAVE_GERADA")
+_ENCRYPTION_KEY_RE = re.compile(r"^ENCRYPTION_KEY=.*$", re.MULTILINE)
+
+# Values containing these markers are still the .env.example placeholders
+_PLACEHOLDER_MARKERS = ("your-", "SUBSTITUA")
 
 
 def print_header(text):
@@ -18,7 +25,8 @@ def print_header(text):
 
 def generate_encryption_key():
     """Generate and return encryption key"""
-    return Fernet.generate_key().decode()
+    # Same as Fernet.generate_key(), without importing cryptography
+    return base64.urlsafe_b64encode(secrets.token_bytes(32)).decode()
 
 
 def update_env_file(key):
@@ -32,22 +40,21 @@ def update_env_file(key):
     # Read current content
     content = env_path.read_text(encoding="utf-8")
 
-    # Replace placeholder
-    if "SUBSTITUA_PELA_CHAVE_GERADA" in content:
-        content = content.replace("SUBSTITUA_PELA_CHAVE_GERADA", key)
-        env_path.write_text(content, encoding="utf-8")
+    # Replace placeholder (detect and substitute in one pass)
+    new_content, replaced = _PLACEHOLDER_RE.subn(key, content, count=1)
+    if replaced:
+        env_path.write_text(new_content, encoding="utf-8")
         print("✅ Chave de criptografia adicionada ao .env")
         return True
-    elif "ENCRYPTION_KEY=" in content and key not in content:
+    elif _ENCRYPTION_KEY_RE.search(content) and key not in content:
         print("⚠️  .env já possui uma ENCRYPTION_KEY. Deseja substituir? (s/n): ", end="")
         response = input().strip().lower()
         if response == "s":
-            lines = content.split("\n")
-            for i, line in enumerate(lines):
-                if line.startswith("ENCRYPTION_KEY="):
-                    lines[i] = f"ENCRYPTION_KEY={key}"
-                    break
-            env_path.write_text("\n".join(lines), encoding="utf-8")
+            new_content = _ENCRYPTION_KEY_RE.sub(
+                lambda _: f"ENCRYPTION_KEY={key}", content, count=1
+            )
+            if new_content != content:
+                env_path.write_text(new_content, encoding="utf-8")
             print("✅ Chave de criptografia atualizada")
             return True
     else:
@@ -68,22 +75,24 @@ def check_env_variables():
         "ENCRYPTION_KEY": "Encryption Key",
     }
 
+    env = os.environ
+    lines = []
     missing = []
 
     for var, description in required_vars.items():
-        value = os.getenv(var, "")
-        if not value or "your-" in value or "SUBSTITUA" in value:
+        value = env.get(var, "")
+        if not value or any(marker in value for marker in _PLACEHOLDER_MARKERS):
             missing.append(f"  ❌ {var} - {description}")
         else:
-            print(f"  ✅ {var}")
+            lines.append(f"  ✅ {var}")
 
     if missing:
-        print("\n⚠️  Variáveis faltando ou não configuradas:")
-        for item in missing:
-            print(item)
-        return False
+        lines.append("\n⚠️  Variáveis faltando ou não configuradas:")
+        lines.extend(missing)
 
-    return True
+    # Single write for the whole report
+    print("\n".join(lines))
+    return not missing
 
 
 def create_downloads_dir():
@@ -2,41 +2,102 @@
 Pytest configuration and shared fixtures
 """
 import asyncio
-from collections.abc import AsyncGenerator
+import sys
+from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import pytest
 import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from httpx import ASGITransport, AsyncClient, Cookies
+from pytest_asyncio import is_async_test
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import Settings, get_settings
 from app.db.database import get_db
-from app.domain.models import Base
-from app.main import create_app
+from app.domain.models import Base, Course, Coursework, DownloadJob, User, VideoLink
+from app.main import app as main_app
+from tests.factories import make_course, make_coursework, make_user, make_video_link
+
+# ORM models whose tables the suite needs; only these are created
+TABLES_FOR_TESTS = [User, Course, Coursework, VideoLink, DownloadJob]
+
+
+class Baseline(NamedTuple):
+    """IDs of the user/course/coursework/video link graph seeded once per session"""
+
+    user_id: int
+    course_id: int
+    coursework_id: int
+    video_link_id: int
+
+
+# Sessions joined to the test transaction (bound per test to db_connection):
+# commits only release a SAVEPOINT, so the rollback in db_connection wipes
+# everything the test wrote. No autoflush (repositories and seed flush
+# explicitly) and no expiry on commit, so reading attributes such as job.id
+# after a commit does not SELECT again.
+TestSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    join_transaction_mode="create_savepoint",
+    expire_on_commit=False,
+    autoflush=False,
+)
 
 
-# Pytest configuration for async tests
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """
+    Event loop policy for async tests: uvloop when available (not on Windows)
+
+    Returns:
+        Event loop policy used by pytest-asyncio
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
 
+            return uvloop.EventLoopPolicy()
+        except ImportError:
+            pass
+    return asyncio.DefaultEventLoopPolicy()
 
-@pytest_asyncio.fixture
-async def test_settings(tmp_path: Path) -> Settings:
+
+@pytest.fixture(scope="session")
+def test_database_url() -> str:
+    """
+    In-memory SQLite database for this test process
+
+    The engine keeps a single connection (StaticPool), so the database lives
+    as long as the session. Each pytest-xdist worker is its own process and
+    therefore gets its own database.
+
+    Returns:
+        Database URL
     """
-    Test-specific settings with in-memory database and temporary directories
+    return "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture(scope="session")
+def test_settings(
+    tmp_path_factory: pytest.TempPathFactory,
+    test_database_url: str,
+) -> Settings:
+    """
+    Test-specific settings with an in-memory database and temporary directories
 
     Returns:
         Settings instance configured for testing
     """
-    download_dir = tmp_path / "downloads"
-    download_dir.mkdir(exist_ok=True)
+    download_dir = tmp_path_factory.mktemp("downloads")
 
     return Settings(
         # Application
@@ -46,8 +107,8 @@ async def test_settings(tmp_path: Path) -> Settings:
         host="0.0.0.0",
         port=8001,
 
-        # Database - use SQLite in-memory for tests
-        database_url="sqlite+aiosqlite:///:memory:",
+        # Database - in-memory SQLite per test process
+        database_url=test_database_url,
 
         # Google OAuth2 - dummy values for tests
         google_client_id="test-client-id",
@@ -71,135 +132,231 @@ async def test_settings(tmp_path: Path) -> Settings:
     )
 
 
-@pytest_asyncio.fixture
-async def async_engine(test_settings: Settings) -> AsyncGenerator[AsyncEngine, None]:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_engine(test_database_url: str) -> AsyncGenerator[AsyncEngine, None]:
     """
     Create async SQLAlchemy engine for tests
 
-    Uses in-memory SQLite database that is created fresh for each test
+    Uses the process's in-memory SQLite database, whose schema is created
+    once for the whole test session; tests are isolated by rolling back their transaction
 
     Args:
-        test_settings: Test configuration
+        test_database_url: Database URL for this test process
 
     Yields:
         AsyncEngine instance
     """
     engine = create_async_engine(
-        test_settings.database_url,
+        test_database_url,
         echo=False,  # Set to True for SQL debugging
         connect_args={"check_same_thread": False},  # SQLite specific
+        # One connection: everything runs inside the test transaction, and
+        # a second connection would block on SQLite's write lock
+        poolclass=StaticPool,
     )
 
-    # Create all tables
+    # pysqlite defers BEGIN, which breaks SAVEPOINTs; emit it ourselves
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin_transaction(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    # Create the test tables; the database is new, so skip existence checks
+    tables = [model.__table__ for model in TABLES_FOR_TESTS]
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(Base.metadata.create_all, tables=tables, checkfirst=False)
 
     yield engine
 
-    # Drop all tables and dispose
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def seed_baseline(async_engine: AsyncEngine) -> Baseline:
+    """
+    Insert the user/course/coursework/video link graph once per session
+
+    The rows are committed, so every test sees them; changes a test makes
+    to them are rolled back with its transaction.
+
+    Usage:
+        user_id, course_id, coursework_id, video_link_id = seed_baseline
+
+    Args:
+        async_engine: Database engine
+
+    Returns:
+        Baseline with the IDs of the seeded rows
+    """
+    async with async_engine.begin() as connection:
+        async with AsyncSession(bind=connection) as session:
+            user_id = await make_user(
+                session,
+                email="baseline@example.com",
+                name="Baseline User",
+                google_id="baseline_google_id",
+            )
+            course_id = await make_course(
+                session,
+                user_id,
+                google_course_id="baseline_course",
+                name="Baseline Course",
+            )
+            coursework_id = await make_coursework(
+                session,
+                course_id,
+                google_coursework_id="baseline_coursework",
+                title="Baseline Assignment",
+            )
+            video_link_id = await make_video_link(
+                session,
+                coursework_id,
+                url="https://drive.google.com/file/d/baseline_video_id/view",
+                drive_file_id="baseline_video_id",
+            )
+            return Baseline(user_id, course_id, coursework_id, video_link_id)
+
+
 @pytest_asyncio.fixture
-async def async_session_factory(
+async def db_connection(
     async_engine: AsyncEngine,
-) -> sessionmaker:
+    seed_baseline: Baseline,
+) -> AsyncGenerator[AsyncConnection, None]:
     """
-    Create async session factory for tests
+    Open a connection with an outer transaction rolled back after the test
+
+    Depends on seed_baseline so the baseline rows are there for every test,
+    whether or not it asks for them.
 
     Args:
         async_engine: Database engine
+        seed_baseline: Baseline rows committed once per session
 
-    Returns:
-        Session factory
-    """
-    return sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autocommit=False,
-        autoflush=False,
-    )
+    Yields:
+        AsyncConnection inside a transaction
+    """
+    async with async_engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            yield connection
+        finally:
+            await transaction.rollback()
 
 
 @pytest_asyncio.fixture
 async def db_session(
-    async_session_factory: sessionmaker,
+    db_connection: AsyncConnection,
 ) -> AsyncGenerator[AsyncSession, None]:
     """
     Create database session for tests
 
-    Each test gets a fresh session that is rolled back after the test
+    Each test gets a fresh session whose changes are rolled back after the test;
+    commit() only releases a SAVEPOINT, so no table needs clearing afterwards
 
     Args:
-        async_session_factory: Session factory
+        db_connection: Connection with the test transaction
 
     Yields:
         AsyncSession instance
     """
-    async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    async with TestSessionLocal(bind=db_connection) as session:
+        yield session
 
 
-@pytest_asyncio.fixture
-async def app(test_settings: Settings, async_engine: AsyncEngine):
+@pytest.fixture
+def seed(db_session: AsyncSession):
     """
-    Create FastAPI application for tests
+    Add test objects in one batch
+
+    Usage:
+        user, = await seed(User(...))
 
     Args:
-        test_settings: Test configuration
-        async_engine: Database engine
+        db_session: Database session
 
     Returns:
-        FastAPI application instance
+        Async function that adds all objects and flushes once
+    """
+    async def _seed(*objs: Any) -> tuple[Any, ...]:
+        db_session.add_all(objs)
+        await db_session.flush()
+        return objs
+
+    return _seed
+
+
+@pytest.fixture(scope="session")
+def app(test_settings: Settings):
     """
-    from app.db.database import engine as prod_engine
+    FastAPI application for tests (once per session)
 
+    Reuses the app built when app.main is imported instead of calling
+    create_app() again. Only session-wide overrides are set here; per-test
+    ones (like the database, see override_db) are swapped in
+    dependency_overrides by function-scoped fixtures.
+
+    Args:
+        test_settings: Test configuration
+
+    Yields:
+        FastAPI application instance
+    """
     # Override settings
     def get_test_settings():
         return test_settings
 
-    # Create app
-    test_app = create_app()
+    # Without override_db, never fall back to the real DATABASE_URL
+    def get_db_without_test_session():
+        raise RuntimeError("Endpoint needs the database: use the client fixture")
 
     # Override dependencies
-    test_app.dependency_overrides[get_settings] = get_test_settings
+    main_app.dependency_overrides[get_settings] = get_test_settings
+    main_app.dependency_overrides[get_db] = get_db_without_test_session
+
+    # Build the OpenAPI schema once; later app.openapi() calls return it cached
+    main_app.openapi()
+
+    yield main_app
+
+    main_app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def override_db(app, db_session: AsyncSession):
+    """
+    Point the app's get_db at this test's session for the test duration
+
+    Requests share the test's session, so they see its uncommitted data and
+    objects; their commits only release a SAVEPOINT (see TestSessionLocal).
 
-    # Override database session
+    Args:
+        app: FastAPI application
+        db_session: Session of the test transaction
+    """
     async def override_get_db():
-        async_session_factory = sessionmaker(
-            async_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-        async with async_session_factory() as session:
-            try:
-                yield session
-                await session.commit()
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
-
-    test_app.dependency_overrides[get_db] = override_get_db
-
-    return test_app
+        try:
+            yield db_session
+            await db_session.commit()
+        except Exception:
+            await db_session.rollback()
+            raise
 
+    previous = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+    app.dependency_overrides[get_db] = previous
 
-@pytest_asyncio.fixture
-async def client(app) -> AsyncGenerator[AsyncClient, None]:
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client(app) -> AsyncGenerator[AsyncClient, None]:
     """
-    Create async HTTP test client
+    Create the async HTTP test client shared by the whole session
+
+    Use it directly for endpoints that never touch the database; it skips
+    the per-test transaction that the client fixture sets up.
 
     Args:
         app: FastAPI application
@@ -212,6 +369,30 @@ async def client(app) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
 
+@pytest.fixture
+def client(http_client: AsyncClient, override_db) -> Generator[AsyncClient, None, None]:
+    """
+    Async HTTP test client bound to this test's database transaction
+
+    The client is shared by the session, so headers and cookies a test sets
+    on it (client.headers.update(...)) are restored afterwards.
+
+    Args:
+        http_client: Shared HTTP client
+        override_db: Binds get_db to the test session
+
+    Yields:
+        AsyncClient instance
+    """
+    headers = http_client.headers.copy()
+    cookies = Cookies(http_client.cookies)
+    try:
+        yield http_client
+    finally:
+        http_client.headers = headers
+        http_client.cookies = cookies
+
+
 @pytest.fixture
 def mock_cookies() -> dict[str, str]:
     """
@@ -325,8 +506,15 @@ def pytest_configure(config):
 # Auto-apply markers based on test location
 def pytest_collection_modifyitems(config, items):
     """Auto-apply markers based on test file location"""
+    # Async tests share the session event loop of the session-scoped engine
+    session_loop = pytest.mark.asyncio(loop_scope="session")
     for item in items:
-        if "unit" in str(item.fspath):
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+        # Directory names, not substrings of the whole path
+        parts = item.path.parts
+        if "unit" in parts:
             item.add_marker(pytest.mark.unit)
-        elif "integration" in str(item.fspath):
+        elif "integration" in parts:
             item.add_marker(pytest.mark.integration)
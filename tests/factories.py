@@ -0,0 +1,107 @@
+"""
+Test data factories
+
+Each factory inserts one row with a Core INSERT ... RETURNING id, skipping
+the ORM unit of work for rows the test only needs by ID. Required fields
+get defaults (unique where the column is unique); keyword arguments
+override them.
+"""
+from itertools import count
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import (
+    Base,
+    Course,
+    Coursework,
+    DownloadJob,
+    DownloadStatus,
+    User,
+    VideoLink,
+)
+
+# Suffix for default values of unique columns
+_sequence = count(1)
+
+
+async def _insert(session: AsyncSession, model: type[Base], values: dict[str, Any]) -> int:
+    """
+    Insert one row and return its ID
+
+    Args:
+        session: Database session
+        model: ORM model of the target table
+        values: Column values
+
+    Returns:
+        ID of the inserted row
+    """
+    result = await session.execute(insert(model).values(**values).returning(model.id))
+    return result.scalar_one()
+
+
+async def make_user(session: AsyncSession, **kwargs: Any) -> int:
+    """Insert a user and return its ID"""
+    n = next(_sequence)
+    values = {
+        "email": f"user{n}@example.com",
+        "name": f"User {n}",
+        "google_id": f"google_id_{n}",
+    }
+    return await _insert(session, User, values | kwargs)
+
+
+async def make_course(session: AsyncSession, owner_id: int, **kwargs: Any) -> int:
+    """Insert a course owned by owner_id and return its ID"""
+    n = next(_sequence)
+    values = {
+        "google_course_id": f"course_{n}",
+        "name": f"Course {n}",
+        "owner_id": owner_id,
+        "state": "ACTIVE",
+    }
+    return await _insert(session, Course, values | kwargs)
+
+
+async def make_coursework(session: AsyncSession, course_id: int, **kwargs: Any) -> int:
+    """Insert a coursework in course_id and return its ID"""
+    n = next(_sequence)
+    values = {
+        "course_id": course_id,
+        "google_coursework_id": f"coursework_{n}",
+        "title": f"Assignment {n}",
+        "state": "PUBLISHED",
+        "work_type": "ASSIGNMENT",
+    }
+    return await _insert(session, Coursework, values | kwargs)
+
+
+async def make_video_link(session: AsyncSession, coursework_id: int, **kwargs: Any) -> int:
+    """Insert a Drive video link in coursework_id and return its ID"""
+    n = next(_sequence)
+    values = {
+        "coursework_id": coursework_id,
+        "url": f"https://drive.google.com/file/d/video_{n}/view",
+        "source_type": "google_drive",
+        "drive_file_id": f"video_{n}",
+    }
+    return await _insert(session, VideoLink, values | kwargs)
+
+
+async def make_download_job(
+    session: AsyncSession,
+    user_id: int,
+    course_id: int,
+    video_link_id: int,
+    **kwargs: Any,
+) -> int:
+    """Insert a pending download job and return its ID"""
+    values = {
+        "user_id": user_id,
+        "course_id": course_id,
+        "video_link_id": video_link_id,
+        "status": DownloadStatus.PENDING,
+    }
+    return await _insert(session, DownloadJob, values | kwargs)
@@ -6,10 +6,9 @@ from httpx import AsyncClient
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_health_endpoint_returns_ok(client: AsyncClient):
+async def test_health_endpoint_returns_ok(http_client: AsyncClient):
     """Test basic health check endpoint"""
-    response = await client.get("/health")
+    response = await http_client.get("/health")
 
     assert response.status_code == 200
     data = response.json()
@@ -19,7 +18,6 @@ async def test_health_endpoint_returns_ok(client: AsyncClient):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_health_db_endpoint_checks_database(client: AsyncClient):
     """Test database health check endpoint"""
     response = await client.get("/health/db")
@@ -31,10 +29,9 @@ async def test_health_db_endpoint_checks_database(client: AsyncClient):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_root_endpoint_returns_api_info(client: AsyncClient):
+async def test_root_endpoint_returns_api_info(http_client: AsyncClient):
     """Test root endpoint returns API information"""
-    response = await client.get("/")
+    response = await http_client.get("/")
 
     assert response.status_code == 200
     data = response.json()
@@ -0,0 +1,76 @@
+"""
+Unit tests for cookie parsing in CookieManager
+"""
+from pathlib import Path
+
+import pytest
+from cryptography.fernet import Fernet
+
+from app.services.cookie_manager import CookieManager
+
+
+@pytest.fixture
+def cookie_manager(tmp_path: Path) -> CookieManager:
+    """CookieManager storing plain cookies in a temp directory"""
+    return CookieManager(cookies_file=tmp_path / "cookies.json")
+
+
+@pytest.mark.unit
+def test_parse_curl_command_cookie_header(cookie_manager: CookieManager):
+    """Test parsing the Cookie header, keeping '=' in values and skipping bad entries"""
+    curl_command = (
+        "curl 'https://classroom.google.com/' "
+        "-H 'accept: */*' "
+        "-H 'Cookie: SID=abc; HSID=a=b==; broken; =orphan; SSID=' "
+        "-H 'user-agent: test'"
+    )
+
+    cookies = cookie_manager.parse_curl_cookies(curl_command)
+
+    assert cookies == {"SID": "abc", "HSID": "a=b==", "SSID": ""}
+
+    # Extra spaces around names, values and separators are stripped
+    cookies = cookie_manager.parse_curl_cookies("curl -H 'Cookie: SID=abc ;  HSID=b ; X = y'")
+
+    assert cookies == {"SID": "abc", "HSID": "b", "X": "y"}
+
+
+@pytest.mark.unit
+def test_parse_curl_file_merges_commands(cookie_manager: CookieManager, tmp_path: Path):
+    """Test parsing -b and Cookie header arguments from several curl commands"""
+    curl_file = tmp_path / "requests.txt"
+    curl_file.write_text(
+        "curl 'https://classroom.google.com/' -b 'SID=old; APISID=x'\n"
+        "curl 'https://drive.google.com/' -H \"Cookie: SID=new; SAPISID=y\"\n",
+        encoding="utf-8",
+    )
+
+    cookies = cookie_manager.parse_curl_file(curl_file)
+
+    assert cookies == {"SID": "new", "APISID": "x", "SAPISID": "y"}
+
+
+@pytest.mark.unit
+def test_parse_curl_file_disk_cache(tmp_path: Path):
+    """Test the curl cache is encrypted-only and keeps one entry per file"""
+    curl_file = tmp_path / "requests.txt"
+    curl_file.write_text("curl 'https://classroom.google.com/' -b 'SID=old'\n", encoding="utf-8")
+    cache_dir = tmp_path / "curl_cache"
+
+    # Plain manager: nothing is written to disk
+    CookieManager(cookies_file=tmp_path / "cookies.json").parse_curl_file(curl_file)
+
+    assert not cache_dir.exists()
+
+    key = Fernet.generate_key().decode()
+    CookieManager(cookies_file=tmp_path / "cookies.json", encryption_key=key).parse_curl_file(
+        curl_file
+    )
+    curl_file.write_text("curl 'https://classroom.google.com/' -b 'SID=new1'\n", encoding="utf-8")
+
+    # Fresh manager, so the result can only come from the file or the disk cache
+    manager = CookieManager(cookies_file=tmp_path / "cookies.json", encryption_key=key)
+
+    assert manager.parse_curl_file(curl_file) == {"SID": "new1"}
+    assert len(list(cache_dir.iterdir())) == 1
+    assert b"new1" not in next(cache_dir.iterdir()).read_bytes()
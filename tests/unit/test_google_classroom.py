@@ -0,0 +1,103 @@
+"""
+Unit tests for Google Classroom video link extraction
+"""
+import pytest
+
+from app.services.google_classroom import ExtractedVideoLink, GoogleClassroomService
+
+
+@pytest.fixture
+def classroom_service() -> GoogleClassroomService:
+    """GoogleClassroomService without API clients (extraction only)"""
+    return GoogleClassroomService.__new__(GoogleClassroomService)
+
+
+@pytest.mark.unit
+def test_extract_video_links_from_description_and_materials(
+    classroom_service: GoogleClassroomService,
+):
+    """Test extracting links from description URLs and attached materials"""
+    item = {
+        "description": "Aula: https://youtu.be/abc e site https://example.com",
+        "materials": [
+            {"youtubeVideo": {"id": "xyz", "title": "Intro"}},
+            {
+                "driveFile": {
+                    "driveFile": {"id": "file_1", "title": "Aula.mp4", "mimeType": "video/mp4"}
+                }
+            },
+            {"driveFile": {"driveFile": {"id": "file_2", "mimeType": "application/pdf"}}},
+        ],
+    }
+
+    links = classroom_service.extract_video_links(item)
+
+    assert links == [
+        ExtractedVideoLink(url="https://youtu.be/abc", title=None, source_type="youtube"),
+        ExtractedVideoLink(
+            url="https://www.youtube.com/watch?v=xyz",
+            title="Intro",
+            source_type="youtube",
+            video_id="xyz",
+        ),
+        ExtractedVideoLink(
+            url="https://drive.google.com/file/d/file_1/view",
+            title="Aula.mp4",
+            source_type="drive",
+            drive_file_id="file_1",
+            drive_mime_type="video/mp4",
+        ),
+    ]
+
+
+@pytest.mark.unit
+def test_extract_video_links_batch_matches_per_item(
+    classroom_service: GoogleClassroomService,
+):
+    """Test batch extraction returns the same links as per-item extraction"""
+    items = [
+        {"description": "https://vimeo.com/1 https://example.com/page"},
+        {},
+        {
+            "description": "https://drive.google.com/file/d/a/view\nhttps://wistia.com/b",
+            "materials": [{"link": {"url": "https://dailymotion.com/c", "title": "Extra"}}],
+        },
+        {"description": ""},
+        {"description": "https://www.YouTube.com/watch?v=d"},
+    ]
+
+    batch = classroom_service.extract_video_links_batch(items)
+
+    assert batch == [classroom_service.extract_video_links(item) for item in items]
+    assert [len(links) for links in batch] == [1, 0, 3, 0, 1]
+
+
+@pytest.mark.unit
+def test_extract_video_links_batch_classifies_by_priority(
+    classroom_service: GoogleClassroomService,
+):
+    """Test a URL naming two video hosts gets the same source as _detect_video_source"""
+    url = "https://drive.google.com/file/d/x/view?ref=youtube.com"
+    items = [{"description": f"Aula: {url}"}]
+
+    batch = classroom_service.extract_video_links_batch(items)
+
+    assert batch == [[ExtractedVideoLink(url=url, title=None, source_type="youtube")]]
+
+
+@pytest.mark.unit
+def test_extract_urls_from_text_classifies_by_priority(
+    classroom_service: GoogleClassroomService,
+):
+    """Test a URL naming two video hosts is classified like _detect_video_source does"""
+    text = "https://vimeo.com/1?next=https://youtu.be/abc e https://example.com"
+
+    links = classroom_service._extract_urls_from_text(text)
+
+    assert links == [
+        ExtractedVideoLink(
+            url="https://vimeo.com/1?next=https://youtu.be/abc",
+            title=None,
+            source_type="youtube",
+        ),
+    ]
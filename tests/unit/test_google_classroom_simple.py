@@ -0,0 +1,155 @@
+"""
+Unit tests for the response cache of GoogleClassroomSimpleService
+"""
+import asyncio
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from app.services import google_classroom_simple
+from app.services.google_classroom_simple import GoogleClassroomSimpleService
+
+BASE_URL = "https://classroom.googleapis.com/v1"
+
+
+class _FakeResponse:
+    def __init__(self, data: Any):
+        self._data = data
+
+    def json(self) -> Any:
+        return self._data
+
+
+class _FakeHTTPClient:
+    """Returns a fresh payload per call and counts the calls per URL"""
+
+    def __init__(self):
+        self.calls: dict[str, int] = {}
+
+    async def get(self, url: str, params: Any = None) -> _FakeResponse:
+        self.calls[url] = self.calls.get(url, 0) + 1
+        return _FakeResponse({"items": [{"id": "1", "call": self.calls[url]}]})
+
+
+class _ConcurrentFakeHTTPClient(_FakeHTTPClient):
+    """Yields mid-request, records the peak of concurrent calls and echoes the URL"""
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url: str, params: Any = None) -> _FakeResponse:
+        await super().get(url, params)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        items = [{"url": url}]
+        return _FakeResponse({"courseWork": items, "courseWorkMaterial": items})
+
+
+@pytest.fixture
+def classroom_service() -> Generator[GoogleClassroomSimpleService, None, None]:
+    """Service with a fake HTTP client and an empty response cache"""
+    google_classroom_simple._response_cache.clear()
+    service = GoogleClassroomSimpleService.__new__(GoogleClassroomSimpleService)
+    service.http_client = _FakeHTTPClient()
+    service.base_url = BASE_URL
+    yield service
+    google_classroom_simple._response_cache.clear()
+
+
+@pytest.mark.unit
+async def test_get_json_serves_cache_hits_as_copies(
+    classroom_service: GoogleClassroomSimpleService,
+):
+    """Test a cached response is reused without sharing mutable objects"""
+    url = f"{BASE_URL}/courses"
+
+    first = await classroom_service._get_json(url, {"pageSize": 100})
+    first["items"].append({"id": "mutated"})
+    second = await classroom_service._get_json(url, {"pageSize": 100})
+
+    assert classroom_service.http_client.calls[url] == 1
+    assert second == {"items": [{"id": "1", "call": 1}]}
+
+
+@pytest.mark.unit
+async def test_get_json_refetches_after_expiry(
+    classroom_service: GoogleClassroomSimpleService,
+):
+    """Test an expired entry is fetched again"""
+    url = f"{BASE_URL}/courses"
+    await classroom_service._get_json(url)
+
+    # Expire every entry
+    cache = google_classroom_simple._response_cache
+    for key, (_, data) in list(cache.items()):
+        cache[key] = (0.0, data)
+
+    data = await classroom_service._get_json(url)
+
+    assert classroom_service.http_client.calls[url] == 2
+    assert data["items"][0]["call"] == 2
+
+
+@pytest.mark.unit
+async def test_invalidate_course_drops_only_that_course(
+    classroom_service: GoogleClassroomSimpleService,
+):
+    """Test invalidate(course_id) refetches that course and keeps the others cached"""
+    course_a = f"{BASE_URL}/courses/a/courseWork"
+    course_b = f"{BASE_URL}/courses/b/courseWork"
+    await classroom_service._get_json(course_a)
+    await classroom_service._get_json(course_b)
+
+    classroom_service.invalidate("a")
+    await classroom_service._get_json(course_a)
+    await classroom_service._get_json(course_b)
+
+    assert classroom_service.http_client.calls == {course_a: 2, course_b: 1}
+
+    classroom_service.invalidate()
+    await classroom_service._get_json(course_b)
+
+    assert classroom_service.http_client.calls[course_b] == 2
+
+
+@pytest.mark.unit
+def test_extract_video_links_stops_urls_at_unicode_spaces(
+    classroom_service: GoogleClassroomSimpleService,
+):
+    """Test description URLs end at a non-breaking or em space"""
+    item = {"description": "Aula https://youtu.be/abc\xa0parte 1 e https://vimeo.com/2\u2003fim"}
+
+    links = list(classroom_service.extract_video_links(item))
+
+    assert [link["url"] for link in links] == ["https://youtu.be/abc", "https://vimeo.com/2"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("method", "items_key", "path"),
+    [
+        ("list_coursework_bulk", "coursework", "courseWork"),
+        ("list_course_materials_bulk", "materials", "courseWorkMaterials"),
+    ],
+)
+async def test_bulk_listing_bounds_concurrency_and_maps_by_course(
+    classroom_service: GoogleClassroomSimpleService,
+    method: str,
+    items_key: str,
+    path: str,
+):
+    """Test bulk listings keep at most `concurrency` requests in flight, keyed by course"""
+    http_client = classroom_service.http_client = _ConcurrentFakeHTTPClient()
+    course_ids = ["a", "b", "c", "d", "e"]
+
+    results = await getattr(classroom_service, method)(course_ids, concurrency=2)
+
+    assert http_client.max_in_flight == 2
+    assert list(results) == course_ids
+    for course_id, result in results.items():
+        assert result[items_key] == [{"url": f"{BASE_URL}/courses/{course_id}/{path}"}]
@@ -13,19 +13,20 @@ from app.domain.models import (
     Coursework,
 )
 from app.repositories.course_repository import CourseRepository
+from app.repositories.coursework_repository import CourseworkRepository
 from app.repositories.download_job_repository import DownloadJobRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.video_link_repository import VideoLinkRepository
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_user_repository_add(db_session: AsyncSession):
     """Test adding a user to the database"""
     repo = UserRepository(db_session)
 
     user = User(
         email="test@example.com",
+        name="Test User",
         google_id="test_google_id_123",
     )
 
@@ -38,13 +39,13 @@ async def test_user_repository_add(db_session: AsyncSession):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_user_repository_get(db_session: AsyncSession):
     """Test getting a user by ID"""
     repo = UserRepository(db_session)
 
     user = User(
         email="test@example.com",
+        name="Test User",
         google_id="test_google_id_123",
     )
     await repo.add(user)
@@ -58,7 +59,6 @@ async def test_user_repository_get(db_session: AsyncSession):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_user_repository_get_nonexistent(db_session: AsyncSession):
     """Test getting a non-existent user returns None"""
     repo = UserRepository(db_session)
@@ -69,14 +69,12 @@ async def test_user_repository_get_nonexistent(db_session: AsyncSession):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_course_repository_add(db_session: AsyncSession):
     """Test adding a course to the database"""
     # Create user first
     user_repo = UserRepository(db_session)
-    user = User(email="test@example.com", google_id="test_google_id")
+    user = User(email="test@example.com", name="Test User", google_id="test_google_id")
     await user_repo.add(user)
-    await db_session.commit()
 
     # Add course
     course_repo = CourseRepository(db_session)
@@ -96,12 +94,11 @@ async def test_course_repository_add(db_session: AsyncSession):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_course_repository_get_by_user(db_session: AsyncSession):
     """Test getting courses by user ID"""
     # Create user
     user_repo = UserRepository(db_session)
-    user = User(email="test@example.com", google_id="test_google_id")
+    user = User(email="test@example.com", name="Test User", google_id="test_google_id")
     await user_repo.add(user)
 
     # Add courses
@@ -118,8 +115,7 @@ async def test_course_repository_get_by_user(db_session: AsyncSession):
         owner_id=user.id,
         state="ACTIVE",
     )
-    await course_repo.add(course1)
-    await course_repo.add(course2)
+    await course_repo.add_all([course1, course2])
     await db_session.commit()
 
     # Query
@@ -130,67 +126,25 @@ async def test_course_repository_get_by_user(db_session: AsyncSession):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_download_job_repository_get_by_status(db_session: AsyncSession):
+async def test_download_job_repository_get_by_status(db_session: AsyncSession, seed_baseline):
     """Test getting download jobs by status"""
-    # Create test data
-    user_repo = UserRepository(db_session)
-    user = User(email="test@example.com", google_id="test_google_id")
-    await user_repo.add(user)
-
-    course_repo = CourseRepository(db_session)
-    course = Course(
-        google_course_id="course_123",
-        name="Test Course",
-        owner_id=user.id,
-        state="ACTIVE",
-    )
-    await course_repo.add(course)
+    user_id, course_id, _, video_link_id = seed_baseline
 
-    coursework_repo = app.repositories.coursework_repository.CourseworkRepository(
-        db_session
-    )
-    coursework = Coursework(
-        course_id=course.id,
-        google_coursework_id="coursework_123",
-        title="Test Assignment",
-        state="PUBLISHED",
-        work_type="ASSIGNMENT",
-    )
-    await coursework_repo.add(coursework)
-
-    video_link_repo = VideoLinkRepository(db_session)
-    video_link = VideoLink(
-        coursework_id=coursework.id,
-        url="https://drive.google.com/file/d/test/view",
-        source_type="google_drive",
-        drive_file_id="test",
-    )
-    await video_link_repo.add(video_link)
-
-    # Create jobs with different statuses
+    # Create jobs with different statuses (one executemany INSERT)
     job_repo = DownloadJobRepository(db_session)
-    job1 = DownloadJob(
-        user_id=user.id,
-        course_id=course.id,
-        video_link_id=video_link.id,
-        status=DownloadStatus.PENDING,
-    )
-    job2 = DownloadJob(
-        user_id=user.id,
-        course_id=course.id,
-        video_link_id=video_link.id,
-        status=DownloadStatus.PENDING,
-    )
-    job3 = DownloadJob(
-        user_id=user.id,
-        course_id=course.id,
-        video_link_id=video_link.id,
-        status=DownloadStatus.COMPLETED,
+    await job_repo.create_many(
+        {
+            "user_id": user_id,
+            "course_id": course_id,
+            "video_link_id": video_link_id,
+            "status": status,
+        }
+        for status in (
+            DownloadStatus.PENDING,
+            DownloadStatus.PENDING,
+            DownloadStatus.COMPLETED,
+        )
     )
-    await job_repo.add(job1)
-    await job_repo.add(job2)
-    await job_repo.add(job3)
     await db_session.commit()
 
     # Query pending jobs
@@ -201,57 +155,21 @@ async def test_download_job_repository_get_by_status(db_session: AsyncSession):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_download_job_repository_update_status(db_session: AsyncSession):
+async def test_download_job_repository_update_status(db_session: AsyncSession, seed_baseline):
     """Test updating download job status"""
-    # Create test data
-    user_repo = UserRepository(db_session)
-    user = User(email="test@example.com", google_id="test_google_id")
-    await user_repo.add(user)
-
-    course_repo = CourseRepository(db_session)
-    course = Course(
-        google_course_id="course_123",
-        name="Test Course",
-        owner_id=user.id,
-        state="ACTIVE",
-    )
-    await course_repo.add(course)
-
-    coursework_repo = app.repositories.coursework_repository.CourseworkRepository(
-        db_session
-    )
-    coursework = Coursework(
-        course_id=course.id,
-        google_coursework_id="coursework_123",
-        title="Test Assignment",
-        state="PUBLISHED",
-        work_type="ASSIGNMENT",
-    )
-    await coursework_repo.add(coursework)
-
-    video_link_repo = VideoLinkRepository(db_session)
-    video_link = VideoLink(
-        coursework_id=coursework.id,
-        url="https://drive.google.com/file/d/test/view",
-        source_type="google_drive",
-        drive_file_id="test",
-    )
-    await video_link_repo.add(video_link)
+    user_id, course_id, _, video_link_id = seed_baseline
 
     job_repo = DownloadJobRepository(db_session)
     job = DownloadJob(
-        user_id=user.id,
-        course_id=course.id,
-        video_link_id=video_link.id,
+        user_id=user_id,
+        course_id=course_id,
+        video_link_id=video_link_id,
         status=DownloadStatus.PENDING,
     )
     await job_repo.add(job)
-    await db_session.commit()
 
     # Update status
-    job.status = DownloadStatus.DOWNLOADING
-    await job_repo.update(job)
+    await job_repo.update_status(job.id, DownloadStatus.DOWNLOADING)
     await db_session.commit()
 
     # Verify
@@ -260,55 +178,85 @@ async def test_download_job_repository_update_status(db_session: AsyncSession):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_video_link_repository_get_by_coursework(db_session: AsyncSession):
-    """Test getting video links by coursework ID"""
-    # Create test data
-    user_repo = UserRepository(db_session)
-    user = User(email="test@example.com", google_id="test_google_id")
-    await user_repo.add(user)
-
-    course_repo = CourseRepository(db_session)
-    course = Course(
-        google_course_id="course_123",
-        name="Test Course",
-        owner_id=user.id,
-        state="ACTIVE",
-    )
-    await course_repo.add(course)
+async def test_coursework_repository_get_by_course(db_session: AsyncSession, seed_baseline):
+    """Test getting coursework by course ID"""
+    _, course_id, coursework_id, _ = seed_baseline
 
-    coursework_repo = app.repositories.coursework_repository.CourseworkRepository(
-        db_session
-    )
+    coursework_repo = CourseworkRepository(db_session)
     coursework = Coursework(
-        course_id=course.id,
+        course_id=course_id,
         google_coursework_id="coursework_123",
         title="Test Assignment",
         state="PUBLISHED",
         work_type="ASSIGNMENT",
     )
     await coursework_repo.add(coursework)
+    await db_session.commit()
+
+    # Query (baseline coursework plus the one above)
+    results = await coursework_repo.get_by_course(course_id)
+
+    assert {c.id for c in results} == {coursework_id, coursework.id}
+
+
+@pytest.mark.unit
+async def test_video_link_repository_get_by_coursework(db_session: AsyncSession, seed_baseline):
+    """Test getting video links by coursework ID"""
+    _, _, coursework_id, _ = seed_baseline
 
     # Add video links
     video_link_repo = VideoLinkRepository(db_session)
     link1 = VideoLink(
-        coursework_id=coursework.id,
+        coursework_id=coursework_id,
         url="https://drive.google.com/file/d/test1/view",
         source_type="google_drive",
         drive_file_id="test1",
     )
     link2 = VideoLink(
-        coursework_id=coursework.id,
+        coursework_id=coursework_id,
         url="https://drive.google.com/file/d/test2/view",
         source_type="google_drive",
         drive_file_id="test2",
     )
-    await video_link_repo.add(link1)
-    await video_link_repo.add(link2)
+    await video_link_repo.add_all([link1, link2])
     await db_session.commit()
 
-    # Query
-    results = await video_link_repo.get_by_coursework(coursework.id)
+    # Query (baseline link plus the two above)
+    results = await video_link_repo.get_by_coursework(coursework_id)
 
-    assert len(results) == 2
-    assert all(v.coursework_id == coursework.id for v in results)
+    assert len(results) == 3
+    assert all(v.coursework_id == coursework_id for v in results)
+
+
+@pytest.mark.unit
+async def test_download_job_repository_claim_pending(db_session: AsyncSession, seed_baseline):
+    """Test claiming pending jobs marks them as downloading"""
+    user_id, course_id, _, video_link_id = seed_baseline
+
+    db_session.add_all([
+        DownloadJob(
+            user_id=user_id,
+            course_id=course_id,
+            video_link_id=video_link_id,
+            status=status,
+        )
+        for status in (
+            DownloadStatus.PENDING,
+            DownloadStatus.PENDING,
+            DownloadStatus.PENDING,
+            DownloadStatus.COMPLETED,
+        )
+    ])
+    await db_session.flush()
+
+    job_repo = DownloadJobRepository(db_session)
+    claimed = await job_repo.claim_pending(2)
+    await db_session.commit()
+
+    assert len(claimed) == 2
+    assert all(j.status == DownloadStatus.DOWNLOADING for j in claimed)
+    assert all(j.started_at is not None for j in claimed)
+
+    remaining = await job_repo.get_by_status(DownloadStatus.PENDING)
+    assert len(remaining) == 1
+    assert await job_repo.claim_pending(0) == []
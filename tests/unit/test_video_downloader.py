@@ -0,0 +1,33 @@
+"""
+Unit tests for yt-dlp URL support checks
+"""
+import pytest
+
+from app.services.video_downloader import VideoDownloaderService
+
+
+@pytest.fixture
+def video_downloader() -> VideoDownloaderService:
+    """VideoDownloaderService without a thread pool (URL checks only)"""
+    return VideoDownloaderService.__new__(VideoDownloaderService)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("url", "supported"),
+    [
+        # indexed hosts (and a subdomain of one)
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", True),
+        ("https://m.youtube.com/watch?v=dQw4w9WgXcQ", True),
+        # alias hosts
+        ("https://youtu.be/dQw4w9WgXcQ", True),
+        ("https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ", True),
+        ("https://docs.google.com/file/d/0ByeS4oOUV-49Zzh4R1J6R09zazQ/edit", True),
+        # unsupported hosts
+        ("https://example.com/page", False),
+        ("not a url", False),
+    ],
+)
+def test_is_supported_url(video_downloader: VideoDownloaderService, url: str, supported: bool):
+    """Test URL support is decided from the extractors indexed for the host"""
+    assert video_downloader.is_supported_url(url) is supported